@@ -169,7 +169,7 @@ class LEDDisplaySystem:
         self._network_manager.on_captive_portal_started = self._on_portal_started
         self._network_manager.on_captive_portal_stopped = self._on_portal_stopped
 
-        self._network_manager.start()
+        self._network_manager.start_blocking()
 
         # Start captive portal if WiFi not configured
         # (This is handled by the network manager monitoring)
@@ -184,18 +184,34 @@ class LEDDisplaySystem:
         config = get_config()
         app = get_app()
 
-        # Run uvicorn in a thread
+        # Run uvicorn in a thread. Keep-alive outlasts the UI's polling
+        # interval so pollers reuse their connection; concurrency is
+        # capped for the Pi like the captive portal server.
         server_config = uvicorn.Config(
             app,
             host=config.web.host,
             port=config.web.port,
             log_level="warning",
+            http="httptools",
+            access_log=False,
+            timeout_keep_alive=30,
+            limit_concurrency=100,
         )
 
         self._web_server = uvicorn.Server(server_config)
 
+        # serve() runs on whatever loop it is given, so uvicorn's own uvloop
+        # selection doesn't apply here; uvloop ships with uvicorn[standard]
+        try:
+            import uvloop
+
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+
         def run_server():
-            asyncio.run(self._web_server.serve())
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(self._web_server.serve())
 
         thread = threading.Thread(target=run_server, name="WebServer", daemon=True)
         thread.start()
@@ -259,6 +275,8 @@ class LEDDisplaySystem:
         if self._display_manager:
             self._display_manager.stop()
 
+        ConfigManager.get_instance().flush()
+
         self._shutdown_event.set()
         logger.info("LED Display System stopped")
 
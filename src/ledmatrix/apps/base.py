@@ -5,9 +5,11 @@ along with metadata and configuration schemas.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from PIL import Image
@@ -84,6 +86,33 @@ class ConfigFieldSchema:
     options: list[dict[str, str]] | None = None
 
 
+def _check_int(field_schema: ConfigFieldSchema, value: Any) -> str | None:
+    """Validate an int field value, returning an error message or None."""
+    try:
+        int_val = int(value)
+    except (TypeError, ValueError):
+        return f"{field_schema.label} must be an integer"
+    if field_schema.min_value is not None and int_val < field_schema.min_value:
+        return f"{field_schema.label} must be >= {field_schema.min_value}"
+    if field_schema.max_value is not None and int_val > field_schema.max_value:
+        return f"{field_schema.label} must be <= {field_schema.max_value}"
+    return None
+
+
+def _check_bool(field_schema: ConfigFieldSchema, value: Any) -> str | None:
+    """Validate a bool field value, returning an error message or None."""
+    if not isinstance(value, bool):
+        return f"{field_schema.label} must be a boolean"
+    return None
+
+
+# Type-specific value checks; other field types accept any value
+_FIELD_CHECKS: dict[str, Callable[[ConfigFieldSchema, Any], str | None]] = {
+    "int": _check_int,
+    "bool": _check_bool,
+}
+
+
 @dataclass
 class RenderResult:
     """Result of an app render operation.
@@ -153,6 +182,22 @@ class BaseApp(ABC):
         """
         return {}
 
+    @cached_property
+    def _schema_fields(self) -> tuple[tuple[str, ConfigFieldSchema], ...]:
+        """Schema fields, built once since config_schema creates a new dict per call."""
+        return tuple(self.config_schema.items())
+
+    @cached_property
+    def serialized_schema(self) -> dict[str, dict[str, Any]]:
+        """Configuration schema as plain dicts for the web UI.
+
+        Schemas are static per app, so this is built once per instance.
+
+        Returns:
+            Dict mapping field names to their schema attributes
+        """
+        return {name: asdict(schema) for name, schema in self._schema_fields}
+
     @property
     def state(self) -> AppState:
         """Get current app state."""
@@ -199,7 +244,7 @@ class BaseApp(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        for field_name, field_schema in self.config_schema.items():
+        for field_name, field_schema in self._schema_fields:
             value = self._config.get(field_name)
 
             # Check required fields
@@ -208,19 +253,11 @@ class BaseApp(ABC):
 
             # Type validation
             if value is not None and value != "":
-                if field_schema.type == "int":
-                    try:
-                        int_val = int(value)
-                        if field_schema.min_value is not None and int_val < field_schema.min_value:
-                            return False, f"{field_schema.label} must be >= {field_schema.min_value}"
-                        if field_schema.max_value is not None and int_val > field_schema.max_value:
-                            return False, f"{field_schema.label} must be <= {field_schema.max_value}"
-                    except (TypeError, ValueError):
-                        return False, f"{field_schema.label} must be an integer"
-
-                elif field_schema.type == "bool":
-                    if not isinstance(value, bool):
-                        return False, f"{field_schema.label} must be a boolean"
+                check = _FIELD_CHECKS.get(field_schema.type)
+                if check is not None:
+                    error = check(field_schema, value)
+                    if error:
+                        return False, error
 
         return True, ""
 
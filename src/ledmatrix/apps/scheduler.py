@@ -12,7 +12,8 @@ import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 from PIL import Image
 
@@ -71,6 +72,8 @@ class AppScheduler:
 
         # App storage
         self._apps: ThreadSafeDict[str, ScheduledApp] = ThreadSafeDict()
+        # Read-only name -> app view, rebuilt when registrations change
+        self._app_view: Mapping[str, BaseApp] = MappingProxyType({})
         self._active_app_name: LockedValue[str | None] = LockedValue(None)
 
         # Threads
@@ -103,7 +106,9 @@ class AppScheduler:
             app: App instance to register
         """
         name = app.metadata.name
-        self._apps[name] = ScheduledApp(app=app)
+        with self._lock:
+            self._apps[name] = ScheduledApp(app=app)
+            self._rebuild_app_view()
         logger.info("Registered app: %s (%s)", name, app.metadata.display_name)
 
     def unregister_app(self, name: str) -> None:
@@ -113,7 +118,9 @@ class AppScheduler:
             name: App name to unregister
         """
         if name in self._apps:
-            scheduled = self._apps.pop(name)
+            with self._lock:
+                scheduled = self._apps.pop(name)
+                self._rebuild_app_view()
             if scheduled.app.state == AppState.ACTIVE:
                 scheduled.app.deactivate()
             logger.info("Unregistered app: %s", name)
@@ -130,14 +137,17 @@ class AppScheduler:
         scheduled = self._apps.get(name)
         return scheduled.app if scheduled else None
 
-    def get_all_apps(self) -> dict[str, BaseApp]:
+    def get_all_apps(self) -> Mapping[str, BaseApp]:
         """Get all registered apps.
 
         Returns:
-            Dict mapping app names to app instances
+            Read-only mapping of app names to app instances
         """
-        with self._lock:
-            return {name: s.app for name, s in self._apps.items()}
+        return self._app_view
+
+    def _rebuild_app_view(self) -> None:
+        """Refresh the get_all_apps() view. Must be called with the lock held."""
+        self._app_view = MappingProxyType({name: s.app for name, s in self._apps.items()})
 
     def get_enabled_apps(self) -> list[str]:
         """Get names of enabled apps in registration order.
@@ -426,9 +436,8 @@ def get_app_scheduler() -> AppScheduler | None:
     Returns:
         AppScheduler singleton instance or None if not initialized
     """
-    global _app_scheduler
-    with _scheduler_lock:
-        return _app_scheduler
+    # Reading the global is atomic; the lock only guards init and reset
+    return _app_scheduler
 
 
 def init_app_scheduler(
@@ -7,6 +7,7 @@ Provides type-safe configuration with:
 - Default values for FM6126A panels
 """
 
+import hashlib
 import logging
 import secrets
 import threading
@@ -14,7 +15,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field, SecretStr, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, SecretStr, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +106,42 @@ class WebConfig(BaseModel):
     admin_password_hash: str | None = Field(None, description="Hashed admin password")
     admin_password_salt: str | None = Field(None, description="Password salt")
 
+    # Decoded admin password, derived from the fields above on validation
+    _admin_password: tuple[bytes, bytes, str] | None = PrivateAttr(None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Decode the stored admin password once for verification.
+
+        Hashes are stored as "v2$<algorithm>$<hex>"; untagged hex is a
+        legacy PBKDF2-HMAC-SHA256 hash. A malformed hash decodes to an
+        empty one, which no password matches.
+        """
+        if not self.admin_password_hash or not self.admin_password_salt:
+            return
+
+        salt = self.admin_password_salt.encode()
+        stored = self.admin_password_hash
+        algorithm = "sha256"
+        try:
+            if stored.startswith("v2$"):
+                _, algorithm, stored = stored.split("$", 2)
+            if algorithm not in hashlib.algorithms_available:
+                raise ValueError(f"unsupported hash algorithm: {algorithm}")
+            self._admin_password = (bytes.fromhex(stored), salt, algorithm)
+        except ValueError as e:
+            logger.warning("Stored admin password hash is invalid: %s", e)
+            self._admin_password = (b"", salt, "sha256")
+
+    @property
+    def admin_password_bytes(self) -> tuple[bytes, bytes, str] | None:
+        """Stored admin password hash and salt, decoded for verification.
+
+        Returns:
+            Tuple of (raw hash, salt bytes, PBKDF2 hash name) or None if
+            no password is set
+        """
+        return self._admin_password
+
 
 class ClockAppConfig(BaseModel):
     """Clock app settings."""
@@ -231,9 +268,14 @@ class ConfigManager:
     _instance: "ConfigManager | None" = None
     _instance_lock: threading.Lock = threading.Lock()
 
+    # Seconds a deferred change may sit in memory before it is written
+    SAVE_DELAY = 5.0
+
     def __init__(self, config_path: str | Path) -> None:
         self._config_path = Path(config_path)
         self._config: Config
+        self._version = 0
+        self._save_timer: threading.Timer | None = None
         self._lock = threading.RLock()
         self._load()
 
@@ -296,13 +338,63 @@ class ConfigManager:
             raise
 
     def get(self) -> Config:
-        """Get current configuration (thread-safe copy).
+        """Get the current configuration snapshot.
+
+        Writers never mutate a snapshot in place; every update validates a
+        new Config and swaps it in, so the returned object stays consistent
+        and can be shared between callers without copying. Treat it as
+        read-only.
 
         Returns:
-            Deep copy of current configuration
+            Current configuration
+        """
+        return self._config
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every configuration change."""
+        return self._version
+
+    def _replace(self, data: dict[str, Any], defer_save: bool = False) -> None:
+        """Validate data as the new snapshot and persist it.
+
+        Must be called with the lock held.
+
+        Args:
+            data: New configuration data
+            defer_save: Write after SAVE_DELAY instead of immediately, so
+                bursts of changes cost a single write
         """
+        self._config = Config.model_validate(data)
+        self._version += 1
+
+        if not defer_save:
+            self._cancel_deferred_save()
+            self._save()
+        elif self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._deferred_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _cancel_deferred_save(self) -> None:
+        """Drop a pending deferred write. Must be called with the lock held."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _deferred_save(self) -> None:
+        """Timer callback for deferred writes."""
+        try:
+            self.flush()
+        except Exception:
+            pass  # Already logged by _save()
+
+    def flush(self) -> None:
+        """Write any deferred change to disk now."""
         with self._lock:
-            return self._config.model_copy(deep=True)
+            if self._save_timer is not None:
+                self._cancel_deferred_save()
+                self._save()
 
     def update(self, **kwargs: Any) -> None:
         """Update top-level config sections.
@@ -317,16 +409,14 @@ class ConfigManager:
                     data[key].update(value)
                 else:
                     data[key] = value
-            self._config = Config.model_validate(data)
-            self._save()
+            self._replace(data)
 
     def update_display(self, **kwargs: Any) -> None:
         """Update display settings."""
         with self._lock:
             data = self._config.model_dump()
             data["display"].update(kwargs)
-            self._config = Config.model_validate(data)
-            self._save()
+            self._replace(data)
 
     def update_app(self, app_name: str, **kwargs: Any) -> None:
         """Update specific app settings.
@@ -339,27 +429,36 @@ class ConfigManager:
             data = self._config.model_dump()
             if app_name in data["apps"]:
                 data["apps"][app_name].update(kwargs)
-                self._config = Config.model_validate(data)
-                self._save()
+                self._replace(data)
             else:
                 raise ValueError(f"Unknown app: {app_name}")
 
     def set_active_app(self, app_name: str) -> None:
-        """Set the currently active app."""
+        """Set the currently active app.
+
+        Takes effect immediately; the write to disk is deferred since
+        app switches come in bursts. Call flush() before exiting.
+        """
         with self._lock:
             data = self._config.model_dump()
             data["apps"]["active_app"] = app_name
-            self._config = Config.model_validate(data)
-            self._save()
+            self._replace(data, defer_save=True)
 
-    def set_admin_password(self, password_hash: str, salt: str) -> None:
-        """Set the admin password hash and salt."""
+    def set_admin_password(
+        self, password_hash: bytes, salt: bytes, algorithm: str = "sha512"
+    ) -> None:
+        """Set the admin password hash and salt.
+
+        Args:
+            password_hash: Raw PBKDF2 hash
+            salt: ASCII salt bytes
+            algorithm: PBKDF2 hash name the hash was derived with
+        """
         with self._lock:
             data = self._config.model_dump()
-            data["web"]["admin_password_hash"] = password_hash
-            data["web"]["admin_password_salt"] = salt
-            self._config = Config.model_validate(data)
-            self._save()
+            data["web"]["admin_password_hash"] = f"v2${algorithm}${password_hash.hex()}"
+            data["web"]["admin_password_salt"] = salt.decode()
+            self._replace(data)
 
 
 # =============================================================================
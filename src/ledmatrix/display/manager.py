@@ -300,6 +300,10 @@ def get_display_manager() -> DisplayManager:
         DisplayManager singleton instance
     """
     global _display_manager
+    manager = _display_manager
+    if manager is not None:
+        return manager
+
     with _display_lock:
         if _display_manager is None:
             _display_manager = DisplayManager()
@@ -5,12 +5,19 @@ on non-Raspberry Pi systems.
 """
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Display (width, height) per pixel mapper; None = plain horizontal chain
+_LAYOUT: dict[str | None, Callable[[Any], tuple[int, int]]] = {
+    "U-mapper": lambda o: (o.cols, o.rows * o.chain_length),
+    None: lambda o: (o.cols * o.chain_length, o.rows),
+}
+
 
 class MockRGBMatrixOptions:
     """Mock RGBMatrixOptions for development."""
@@ -47,7 +54,7 @@ class MockCanvas:
 
     def Clear(self) -> None:
         """Clear the canvas."""
-        logger.debug("MockCanvas: Clear")
+        self._image = None
 
     def SetPixel(self, x: int, y: int, r: int, g: int, b: int) -> None:
         """Set a single pixel."""
@@ -56,7 +63,6 @@ class MockCanvas:
     def SetImage(self, image: Image.Image, offset_x: int = 0, offset_y: int = 0) -> None:
         """Set image on canvas."""
         self._image = image
-        logger.debug("MockCanvas: SetImage %dx%d", image.width, image.height)
 
     def get_image(self) -> Image.Image | None:
         """Get the current image (for testing)."""
@@ -76,15 +82,18 @@ class MockMatrix:
 
         self._options = options
         self._brightness = options.brightness
-        self._canvas: MockCanvas | None = None
 
         # Calculate dimensions based on options
-        if "U-mapper" in (options.pixel_mapper_config or ""):
-            self._width = options.cols
-            self._height = options.rows * options.chain_length
-        else:
-            self._width = options.cols * options.chain_length
-            self._height = options.rows
+        mapper = options.pixel_mapper_config
+        key = "U-mapper" if mapper and "U-mapper" in mapper else None
+        self._width, self._height = _LAYOUT[key](options)
+
+        # Double-buffered canvases, swapped by index like real hardware
+        self._canvases = [
+            MockCanvas(self._width, self._height),
+            MockCanvas(self._width, self._height),
+        ]
+        self._front = 0
 
         logger.info(
             "MockMatrix initialized: %dx%d (mock mode)",
@@ -101,7 +110,8 @@ class MockMatrix:
     def brightness(self, value: int) -> None:
         """Set brightness."""
         self._brightness = max(0, min(100, value))
-        logger.debug("MockMatrix: brightness = %d", self._brightness)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockMatrix: brightness = %d", self._brightness)
 
     @property
     def width(self) -> int:
@@ -114,18 +124,29 @@ class MockMatrix:
         return self._height
 
     def CreateFrameCanvas(self) -> MockCanvas:
-        """Create a frame canvas."""
-        self._canvas = MockCanvas(self._width, self._height)
-        return self._canvas
+        """Get the back buffer canvas for drawing."""
+        return self._canvases[1 - self._front]
 
     def SwapOnVSync(self, canvas: MockCanvas) -> MockCanvas:
-        """Swap canvas (simulated vsync)."""
-        # In mock mode, just return a new canvas
-        return MockCanvas(self._width, self._height)
+        """Swap canvas (simulated vsync).
+
+        Returns:
+            The new back buffer, cleared for the next frame
+        """
+        self._front ^= 1
+        back = self._canvases[1 - self._front]
+        back.Clear()
+        return back
+
+    @property
+    def front_canvas(self) -> MockCanvas:
+        """Get the canvas currently "on screen" (for testing)."""
+        return self._canvases[self._front]
 
     def Clear(self) -> None:
         """Clear the display."""
-        logger.debug("MockMatrix: Clear")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockMatrix: Clear")
 
 
 class MockGPIO:
@@ -148,48 +169,53 @@ class MockGPIO:
     FALLING = 32
     BOTH = 33
 
+    # BCM pins fit in [0, 53]; state is packed per pin as mode << 4 | value
+    _NUM_PINS = 64
+    _VALUE_MASK = 0x01
+    _MODE_MASK = 0xF0
+
     _mode: int | None = None
-    _pin_modes: dict[int, int] = {}
-    _pin_values: dict[int, int] = {}
-    _callbacks: dict[int, list[tuple[int, Any]]] = {}
+    _pin_state: bytearray = bytearray([HIGH]) * _NUM_PINS
+    _callbacks: list[list[tuple[int, Any]] | None] = [None] * _NUM_PINS
 
     @classmethod
     def setmode(cls, mode: int) -> None:
         """Set the GPIO numbering mode."""
         cls._mode = mode
-        logger.debug("MockGPIO: setmode(%d)", mode)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: setmode(%d)", mode)
 
     @classmethod
     def setup(cls, pin: int, mode: int, pull_up_down: int = PUD_OFF) -> None:
         """Set up a GPIO pin."""
-        cls._pin_modes[pin] = mode
-        cls._pin_values[pin] = cls.HIGH if pull_up_down == cls.PUD_UP else cls.LOW
-        logger.debug("MockGPIO: setup(%d, %d, %d)", pin, mode, pull_up_down)
+        value = cls.HIGH if pull_up_down == cls.PUD_UP else cls.LOW
+        cls._pin_state[pin] = (mode << 4) | value
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: setup(%d, %d, %d)", pin, mode, pull_up_down)
 
     @classmethod
     def input(cls, pin: int) -> int:
         """Read GPIO pin value."""
-        return cls._pin_values.get(pin, cls.HIGH)
+        return cls._pin_state[pin] & cls._VALUE_MASK
 
     @classmethod
     def output(cls, pin: int, value: int) -> None:
         """Set GPIO pin value."""
-        cls._pin_values[pin] = value
-        logger.debug("MockGPIO: output(%d, %d)", pin, value)
+        cls._pin_state[pin] = (cls._pin_state[pin] & cls._MODE_MASK) | (value & cls._VALUE_MASK)
 
     @classmethod
     def cleanup(cls, pin: int | None = None) -> None:
         """Clean up GPIO."""
         if pin is None:
-            cls._pin_modes.clear()
-            cls._pin_values.clear()
-            cls._callbacks.clear()
+            cls._pin_state[:] = bytearray([cls.HIGH]) * cls._NUM_PINS
+            cls._callbacks[:] = [None] * cls._NUM_PINS
             cls._mode = None
         else:
-            cls._pin_modes.pop(pin, None)
-            cls._pin_values.pop(pin, None)
-            cls._callbacks.pop(pin, None)
-        logger.debug("MockGPIO: cleanup(%s)", pin)
+            cls._pin_state[pin] = cls.HIGH
+            if cls._callbacks[pin] is not None:
+                cls._callbacks[pin] = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: cleanup(%s)", pin)
 
     @classmethod
     def add_event_detect(
@@ -199,27 +225,37 @@ class MockGPIO:
         callback: Any = None,
         bouncetime: int = 0,
     ) -> None:
-        """Add event detection to a pin."""
-        if pin not in cls._callbacks:
-            cls._callbacks[pin] = []
-        if callback:
-            cls._callbacks[pin].append((edge, callback))
-        logger.debug("MockGPIO: add_event_detect(%d, %d)", pin, edge)
+        """Add event detection to a pin.
+
+        Nothing is stored unless a callback is given.
+        """
+        if callback is not None:
+            callbacks = cls._callbacks[pin]
+            if callbacks is None:
+                cls._callbacks[pin] = [(edge, callback)]
+            else:
+                callbacks.append((edge, callback))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: add_event_detect(%d, %d)", pin, edge)
 
     @classmethod
     def remove_event_detect(cls, pin: int) -> None:
         """Remove event detection from a pin."""
-        cls._callbacks.pop(pin, None)
-        logger.debug("MockGPIO: remove_event_detect(%d)", pin)
+        if cls._callbacks[pin] is not None:
+            cls._callbacks[pin] = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: remove_event_detect(%d)", pin)
 
     @classmethod
     def simulate_press(cls, pin: int) -> None:
         """Simulate a button press (for testing)."""
-        cls._pin_values[pin] = cls.LOW
-        logger.debug("MockGPIO: simulate_press(%d)", pin)
+        cls._pin_state[pin] &= cls._MODE_MASK
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: simulate_press(%d)", pin)
 
     @classmethod
     def simulate_release(cls, pin: int) -> None:
         """Simulate a button release (for testing)."""
-        cls._pin_values[pin] = cls.HIGH
-        logger.debug("MockGPIO: simulate_release(%d)", pin)
+        cls._pin_state[pin] |= cls.HIGH
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockGPIO: simulate_release(%d)", pin)
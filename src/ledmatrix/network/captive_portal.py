@@ -5,8 +5,11 @@ for initial network configuration.
 """
 
 import asyncio
+import contextlib
 import logging
-from typing import TYPE_CHECKING
+import uuid
+import weakref
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from ..core.config import get_config
 from ..core.errors import NetworkError
@@ -16,6 +19,47 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Try to import the D-Bus NetworkManager bindings
+try:
+    import sdbus
+    from sdbus_async.networkmanager import (
+        NetworkConnectionSettings,
+        NetworkManagerSettings,
+    )
+    from sdbus_async.networkmanager import NetworkManager as NMProxy
+
+    SDBUS_AVAILABLE = True
+except ImportError:
+    sdbus = None
+    SDBUS_AVAILABLE = False
+    logger.info("sdbus-networkmanager not available, captive portal will use nmcli")
+
+# Connectivity check paths probed by Android, Apple and Windows clients
+_PROBE_PATHS = frozenset(
+    {
+        "generate_204",
+        "gen_204",
+        "hotspot-detect.html",
+        "library/test/success.html",
+        "connecttest.txt",
+        "ncsi.txt",
+    }
+)
+
+
+class _DBusClient(NamedTuple):
+    """System bus connection and the NetworkManager proxies on it."""
+
+    bus: Any
+    nm: Any
+    settings: Any
+
+
+def _prewarm_imports() -> None:
+    """Import the portal web stack so it is cached in sys.modules."""
+    import fastapi  # noqa: F401
+    import uvicorn  # noqa: F401
+
 
 class CaptivePortal:
     """Captive portal for WiFi configuration.
@@ -23,9 +67,13 @@ class CaptivePortal:
     Creates a WiFi access point and runs a simple web server
     to allow users to configure WiFi credentials.
 
-    Uses NetworkManager/nmcli for AP creation (no hostapd needed).
+    Uses NetworkManager for AP creation (no hostapd needed). Talks to
+    it directly over D-Bus when sdbus is available, otherwise via nmcli.
     """
 
+    # Limit for each D-Bus operation before falling back to nmcli (seconds)
+    DBUS_TIMEOUT = 10.0
+
     def __init__(self, network_manager: "NetworkManager") -> None:
         """Initialize captive portal.
 
@@ -35,7 +83,19 @@ class CaptivePortal:
         self._network_manager = network_manager
         self._running = False
         self._web_task: asyncio.Task | None = None
+        self._prewarm_task: asyncio.Task | None = None
         self._connection_name = "led-display-hotspot"
+        self._interface = "wlan0"
+
+        # D-Bus clients per event loop (sdbus buses are loop-bound, and
+        # the portal may be started and stopped from different loops)
+        self._dbus_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _DBusClient
+        ] = weakref.WeakKeyDictionary()
+        self._hotspot_paths: tuple[str, str] | None = None  # (settings, active)
+
+        # Whether the nmcli hotspot profile exists (None = unknown)
+        self._hotspot_exists: bool | None = None
 
     @property
     def is_running(self) -> bool:
@@ -56,7 +116,10 @@ class CaptivePortal:
         logger.info("Starting captive portal AP: %s", network_config.ap_ssid)
 
         try:
-            # Create hotspot using nmcli
+            # Load the web stack in a worker thread while the AP comes up
+            self._prewarm_task = asyncio.create_task(asyncio.to_thread(_prewarm_imports))
+
+            # Create hotspot
             await self._create_hotspot(
                 ssid=network_config.ap_ssid,
                 password=network_config.ap_password,
@@ -70,6 +133,8 @@ class CaptivePortal:
 
         except Exception as e:
             logger.error("Failed to start captive portal: %s", e)
+            # stop() is a no-op before the portal is running
+            self._cancel_prewarm()
             await self.stop()
             raise NetworkError("Failed to start captive portal", cause=e)
 
@@ -88,21 +153,114 @@ class CaptivePortal:
             except asyncio.CancelledError:
                 pass
             self._web_task = None
+        self._cancel_prewarm()
 
         # Stop hotspot
         await self._stop_hotspot()
 
         self._running = False
 
+    def _cancel_prewarm(self) -> None:
+        """Drop the import prewarm if the web server never awaited it."""
+        if self._prewarm_task:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+
+    def _get_dbus(self) -> _DBusClient | None:
+        """Get the D-Bus client for the running loop, connecting on first use.
+
+        Returns:
+            D-Bus client or None if D-Bus is unavailable
+        """
+        if not SDBUS_AVAILABLE:
+            return None
+
+        loop = asyncio.get_running_loop()
+        client = self._dbus_clients.get(loop)
+        if client is None:
+            try:
+                bus = sdbus.sd_bus_open_system()
+                client = _DBusClient(bus, NMProxy(bus), NetworkManagerSettings(bus))
+            except Exception as e:
+                logger.warning("D-Bus connection failed, using nmcli: %s", e)
+                return None
+            self._dbus_clients[loop] = client
+        return client
+
     async def _create_hotspot(self, ssid: str, password: str | None = None) -> None:
+        """Create WiFi hotspot.
+
+        Args:
+            ssid: Hotspot SSID
+            password: Optional password (None = open network)
+        """
+        dbus = self._get_dbus()
+        if dbus is not None:
+            try:
+                async with asyncio.timeout(self.DBUS_TIMEOUT):
+                    await self._create_hotspot_dbus(dbus, ssid, password)
+                logger.info("Hotspot created: %s", ssid)
+                return
+            except Exception as e:
+                logger.warning("D-Bus hotspot creation failed, using nmcli: %s", e)
+                # A profile may have been added before the failure
+                self._hotspot_exists = None
+
+        await self._create_hotspot_nmcli(ssid, password)
+        logger.info("Hotspot created: %s", ssid)
+
+    async def _create_hotspot_dbus(
+        self, dbus: _DBusClient, ssid: str, password: str | None = None
+    ) -> None:
+        """Create and activate the hotspot connection over D-Bus.
+
+        Args:
+            dbus: D-Bus client for the running loop
+            ssid: Hotspot SSID
+            password: Optional password (None = open network)
+        """
+        # Delete stale profiles left over from a previous run
+        for path in await dbus.settings.get_connections_by_id(self._connection_name):
+            await NetworkConnectionSettings(path, dbus.bus).delete()
+
+        profile = {
+            "connection": {
+                "id": ("s", self._connection_name),
+                "uuid": ("s", str(uuid.uuid4())),
+                "type": ("s", "802-11-wireless"),
+                "autoconnect": ("b", False),
+            },
+            "802-11-wireless": {
+                "mode": ("s", "ap"),
+                "band": ("s", "bg"),
+                "ssid": ("ay", ssid.encode()),
+            },
+            "ipv4": {"method": ("s", "shared")},
+            "ipv6": {"method": ("s", "ignore")},
+        }
+        if password:
+            profile["802-11-wireless-security"] = {
+                "key-mgmt": ("s", "wpa-psk"),
+                "psk": ("s", password),
+            }
+
+        conn_path = await dbus.settings.add_connection(profile)
+        device_path = await dbus.nm.get_device_by_ip_iface(self._interface)
+        active_path = await dbus.nm.activate_connection(conn_path, device_path, "/")
+        self._hotspot_paths = (conn_path, active_path)
+
+    async def _create_hotspot_nmcli(self, ssid: str, password: str | None = None) -> None:
         """Create WiFi hotspot using nmcli.
 
         Args:
             ssid: Hotspot SSID
             password: Optional password (None = open network)
         """
-        # Delete existing hotspot connection
-        await self._run_nmcli("connection", "delete", self._connection_name, check=False)
+        # Delete existing hotspot connection (only if one is left over)
+        if await self._hotspot_profile_exists():
+            await self._run_nmcli(
+                "connection", "delete", self._connection_name, check=False, capture_output=False
+            )
 
         # Create hotspot
         cmd = [
@@ -110,7 +268,7 @@ class CaptivePortal:
             "wifi",
             "hotspot",
             "ifname",
-            "wlan0",
+            self._interface,
             "ssid",
             ssid,
             "con-name",
@@ -121,36 +279,76 @@ class CaptivePortal:
             cmd.extend(["password", password])
 
         await self._run_nmcli(*cmd)
-        logger.info("Hotspot created: %s", ssid)
+        self._hotspot_exists = True
+
+    async def _hotspot_profile_exists(self) -> bool:
+        """Check whether the hotspot connection profile exists.
+
+        The result is cached after the first lookup and kept up to date
+        by create/stop, so repeated portal cycles skip the query.
+
+        Returns:
+            True if a profile with the hotspot name exists
+        """
+        if self._hotspot_exists is None:
+            output = await self._run_nmcli("-t", "-f", "NAME", "connection", "show", check=False)
+            self._hotspot_exists = self._connection_name in output.splitlines()
+        return self._hotspot_exists
 
     async def _stop_hotspot(self) -> None:
         """Stop the WiFi hotspot."""
-        await self._run_nmcli("connection", "down", self._connection_name, check=False)
-        await self._run_nmcli("connection", "delete", self._connection_name, check=False)
+        dbus = self._get_dbus() if self._hotspot_paths is not None else None
+        if dbus is not None:
+            conn_path, active_path = self._hotspot_paths
+            self._hotspot_paths = None
+            try:
+                async with asyncio.timeout(self.DBUS_TIMEOUT):
+                    await dbus.nm.deactivate_connection(active_path)
+                    await NetworkConnectionSettings(conn_path, dbus.bus).delete()
+                logger.info("Hotspot stopped")
+                return
+            except Exception as e:
+                logger.warning("D-Bus hotspot teardown failed, using nmcli: %s", e)
+
+        # Deleting an active connection also takes it down
+        await self._run_nmcli(
+            "connection", "delete", self._connection_name, check=False, capture_output=False
+        )
+        self._hotspot_exists = False
         logger.info("Hotspot stopped")
 
-    async def _run_nmcli(self, *args: str, check: bool = True) -> str:
-        """Run nmcli command.
+    async def _run_nmcli(
+        self,
+        *args: str,
+        check: bool = True,
+        capture_output: bool = True,
+    ) -> str:
+        """Run nmcli command (fallback when D-Bus is unavailable).
 
         Args:
             *args: nmcli arguments
             check: Raise on error
+            capture_output: Read stdout (otherwise it is discarded)
 
         Returns:
-            Command output
+            Command output (empty if not captured)
         """
         cmd = ["nmcli", *args]
 
+        # Only open pipes for output we actually read
         proc = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE if check else asyncio.subprocess.DEVNULL,
         )
 
         try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30.0)
-        except asyncio.TimeoutError:
-            proc.kill()
+            async with asyncio.timeout(30.0):
+                stdout, stderr = await proc.communicate()
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
             raise NetworkError("nmcli timeout")
 
         if check and proc.returncode != 0:
@@ -161,9 +359,14 @@ class CaptivePortal:
 
     async def _run_web_server(self) -> None:
         """Run the captive portal web server."""
-        from fastapi import FastAPI, Request, Form
-        from fastapi.responses import HTMLResponse, RedirectResponse
+        # Imports below are cheap once the prewarm has finished
+        if self._prewarm_task:
+            await self._prewarm_task
+            self._prewarm_task = None
+
         import uvicorn
+        from fastapi import FastAPI, Form, HTTPException
+        from fastapi.responses import HTMLResponse, Response
 
         app = FastAPI(title="LED Display Setup")
 
@@ -320,28 +523,29 @@ class CaptivePortal:
             </html>
             """)
 
-        # Captive portal detection endpoints
-        @app.get("/generate_204")
-        @app.get("/gen_204")
-        async def generate_204():
-            return RedirectResponse(url="/", status_code=302)
-
-        @app.get("/hotspot-detect.html")
-        @app.get("/library/test/success.html")
-        async def apple_detect():
-            return RedirectResponse(url="/", status_code=302)
+        # Captive portal detection endpoints (registered last so that
+        # "/" and "/connect" match first)
+        # The redirect never changes, so one Response is built and reused
+        probe_redirect = Response(status_code=302, headers={"location": "/"})
 
-        @app.get("/connecttest.txt")
-        @app.get("/ncsi.txt")
-        async def windows_detect():
-            return RedirectResponse(url="/", status_code=302)
+        @app.get("/{probe:path}")
+        async def detect(probe: str):
+            if probe in _PROBE_PATHS:
+                return probe_redirect
+            raise HTTPException(status_code=404)
 
         # Run server
+        # httptools ships with uvicorn[standard]; probes need no lifespan
+        # events or access logging, and concurrency is capped for the Pi
         server_config = uvicorn.Config(
             app,
             host="0.0.0.0",
             port=network_config.captive_portal_port,
             log_level="warning",
+            http="httptools",
+            lifespan="off",
+            access_log=False,
+            limit_concurrency=32,
         )
         server = uvicorn.Server(server_config)
         await server.serve()
@@ -357,8 +561,35 @@ class CaptivePortal:
 
         try:
             # This will stop the portal and connect
-            await self._network_manager.connect(ssid, password)
+            success = await self._network_manager.connect(ssid, password)
+
+            # Give the monitor a chance to see a slow association
+            if not success and not await self._wait_joined(ssid, timeout=10.0):
+                raise NetworkError(f"Could not connect to {ssid}")
         except Exception as e:
             logger.error("Failed to connect: %s", e)
             # Restart portal on failure
             await self.start()
+
+    async def _wait_joined(self, ssid: str, timeout: float) -> bool:
+        """Wait for the monitor to report a connection to a specific network.
+
+        The connected state alone is not enough: it may still be set from
+        before the connect, and the device also reports connected while
+        it is running the hotspot.
+
+        Args:
+            ssid: Requested network SSID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if connected to ssid before the timeout
+        """
+        manager = self._network_manager
+        try:
+            async with asyncio.timeout(timeout):
+                while not (manager.is_connected and manager.current_ssid == ssid):
+                    await asyncio.sleep(0.5)
+        except TimeoutError:
+            return False
+        return True
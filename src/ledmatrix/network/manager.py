@@ -9,6 +9,7 @@ Provides high-level network management including:
 import asyncio
 import logging
 import threading
+import time
 from typing import Any, Callable
 
 from ..core.config import get_config
@@ -27,7 +28,7 @@ class NetworkManager:
     Usage:
         manager = NetworkManager()
         manager.on_connected = lambda: print("Connected!")
-        manager.start()
+        manager.start_blocking()  # or: manager.start_async(loop)
     """
 
     # Connectivity check endpoints
@@ -37,6 +38,9 @@ class NetworkManager:
         ("http://captive.apple.com/hotspot-detect.html", 200),
     ]
 
+    # How long a connectivity check result is reused (seconds)
+    INTERNET_CHECK_TTL = 15.0
+
     def __init__(self) -> None:
         """Initialize network manager."""
         self._wifi = WiFiManager()
@@ -44,12 +48,19 @@ class NetworkManager:
 
         self._running = False
         self._monitor_thread: StoppableThread | None = None
+        self._monitor_task: asyncio.Task | None = None
 
-        # Connection state
+        # Connection state (snapshot reads from any thread)
         self._is_connected = LockedValue(False)
         self._has_internet = LockedValue(False)
         self._current_ssid = LockedValue[str | None](None)
 
+        # Edge-triggered state (created on the monitor loop)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connected_event: asyncio.Event | None = None
+        self._internet_event: asyncio.Event | None = None
+        self._stop_event: asyncio.Event | None = None
+
         # Callbacks
         self.on_connected: Callable[[], None] | None = None
         self.on_disconnected: Callable[[], None] | None = None
@@ -59,6 +70,9 @@ class NetworkManager:
         # Portal state
         self._portal_active = False
 
+        # Last connectivity check as (monotonic timestamp, result)
+        self._internet_cache: tuple[float, bool] | None = None
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to WiFi."""
@@ -79,13 +93,109 @@ class NetworkManager:
         """Check if captive portal is active."""
         return self._portal_active
 
-    async def scan_networks(self) -> list[WiFiNetwork]:
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        """Wait until the network is connected.
+
+        Can be awaited from any event loop; the wait itself runs on
+        the monitor loop.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = forever)
+
+        Returns:
+            True if connected, False if timeout elapsed
+        """
+        return await self._wait_for_event(self._connected_event, timeout, self.is_connected)
+
+    async def wait_internet(self, timeout: float | None = None) -> bool:
+        """Wait until internet access is available.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = forever)
+
+        Returns:
+            True if internet is accessible, False if timeout elapsed
+        """
+        return await self._wait_for_event(self._internet_event, timeout, self.has_internet)
+
+    async def _wait_for_event(
+        self,
+        event: asyncio.Event | None,
+        timeout: float | None,
+        current: bool,
+    ) -> bool:
+        """Wait for a state event owned by the monitor loop.
+
+        Args:
+            event: Event to wait for
+            timeout: Maximum time to wait in seconds
+            current: Snapshot value used when the monitor is not running
+
+        Returns:
+            True if the event was set, False if timeout elapsed
+        """
+        loop = self._loop
+        if event is None or loop is None or loop.is_closed():
+            # Monitor not running - fall back to the current snapshot
+            return current
+
+        async def wait() -> bool:
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+                return True
+            except TimeoutError:
+                return False
+
+        if asyncio.get_running_loop() is loop:
+            return await wait()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(wait(), loop))
+
+    def _set_state(self, is_connected: bool, has_internet: bool) -> None:
+        """Update connection state and signal waiters.
+
+        Args:
+            is_connected: WiFi connection state
+            has_internet: Internet accessibility
+        """
+        self._is_connected.set(is_connected)
+        self._has_internet.set(has_internet)
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+
+        def apply() -> None:
+            for event, value in (
+                (self._connected_event, is_connected),
+                (self._internet_event, has_internet),
+            ):
+                if event is None:
+                    continue
+                if value:
+                    event.set()
+                else:
+                    event.clear()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            apply()
+        else:
+            loop.call_soon_threadsafe(apply)
+
+    async def scan_networks(self, force: bool = False) -> list[WiFiNetwork]:
         """Scan for available WiFi networks.
 
+        Args:
+            force: Rescan even if cached results are still fresh
+
         Returns:
             List of discovered networks
         """
-        return await self._wifi.scan_networks()
+        return await self._wifi.scan_networks(force=force)
 
     async def connect(self, ssid: str, password: str = "") -> bool:
         """Connect to a WiFi network.
@@ -102,14 +212,14 @@ class NetworkManager:
             await self.stop_captive_portal()
 
         success = await self._wifi.connect(ssid, password)
+        self._invalidate_internet_cache()
 
         if success:
-            self._is_connected.set(True)
             self._current_ssid.set(ssid)
 
             # Check internet
             has_internet = await self._check_internet()
-            self._has_internet.set(has_internet)
+            self._set_state(True, has_internet)
 
             if self.on_connected:
                 try:
@@ -125,8 +235,8 @@ class NetworkManager:
     async def disconnect(self) -> None:
         """Disconnect from current network."""
         await self._wifi.disconnect()
-        self._is_connected.set(False)
-        self._has_internet.set(False)
+        self._invalidate_internet_cache()
+        self._set_state(False, False)
         self._current_ssid.set(None)
 
         if self.on_disconnected:
@@ -200,8 +310,29 @@ class NetworkManager:
             except Exception as e:
                 logger.error("Error in portal stopped callback: %s", e)
 
-    def start(self) -> None:
-        """Start the network manager and monitoring."""
+    def start_async(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Start monitoring as a task on an existing event loop.
+
+        Must be called from the loop's thread. Use stop_async() to stop.
+
+        Args:
+            loop: Event loop to run on (default: the running loop)
+        """
+        if self._running:
+            return
+
+        logger.info("Starting network manager")
+        self._running = True
+
+        loop = loop or asyncio.get_running_loop()
+        self._bind_loop(loop)
+        self._monitor_task = loop.create_task(self._monitor_coro())
+
+    def start_blocking(self) -> None:
+        """Start monitoring on a dedicated thread with its own event loop.
+
+        Fallback for callers that do not run asyncio. Use stop() to stop.
+        """
         if self._running:
             return
 
@@ -216,85 +347,171 @@ class NetworkManager:
         self._monitor_thread.start()
 
     def stop(self) -> None:
-        """Stop the network manager."""
+        """Stop the network manager.
+
+        Meant for start_blocking(). A monitor task from start_async() is
+        cancelled on its loop without waiting; use stop_async() to wait.
+        """
         if not self._running:
             return
 
         logger.info("Stopping network manager")
         self._running = False
+        self._signal_stop()
 
         if self._monitor_thread:
             self._monitor_thread.stop(timeout=5.0)
             self._monitor_thread = None
 
+        if self._monitor_task:
+            loop = self._monitor_task.get_loop()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._monitor_task.cancel)
+            self._monitor_task = None
+
         # Stop captive portal synchronously
         if self._portal_active and self._captive_portal:
             asyncio.run(self._captive_portal.stop())
             self._portal_active = False
 
+    async def stop_async(self) -> None:
+        """Stop the network manager (after start_async)."""
+        if not self._running:
+            return
+
+        logger.info("Stopping network manager")
+        self._running = False
+        self._signal_stop()
+
+        if self._monitor_task:
+            await self._monitor_task
+            self._monitor_task = None
+
+        await self.stop_captive_portal()
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Create the state events for the loop the monitor runs on.
+
+        Args:
+            loop: Monitor event loop
+        """
+        self._loop = loop
+        self._connected_event = asyncio.Event()
+        self._internet_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+
+    def _signal_stop(self) -> None:
+        """Wake the monitor coroutine so it notices the stop request."""
+        loop = self._loop
+        if loop is not None and self._stop_event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._stop_event.set)
+
     def _monitor_loop(self, thread: StoppableThread) -> None:
+        """Connection monitoring thread entry point."""
+        asyncio.run(self._monitor_coro())
+
+    async def _monitor_coro(self) -> None:
         """Connection monitoring loop."""
         logger.debug("Network monitor started")
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._bind_loop(loop)
         was_connected = False
+        await self._wifi.start_monitor()
 
-        while not thread.should_stop():
-            try:
-                # Check connection status
-                is_connected = asyncio.run(self._wifi.is_connected())
-                has_internet = asyncio.run(self._check_internet()) if is_connected else False
-
-                self._is_connected.set(is_connected)
-                self._has_internet.set(has_internet)
-
-                if is_connected:
-                    ssid = asyncio.run(self._wifi.get_current_ssid())
-                    self._current_ssid.set(ssid)
-
-                # Detect state changes
-                if is_connected and not was_connected:
-                    logger.info("Network connected")
-                    if self.on_connected:
-                        try:
-                            self.on_connected()
-                        except Exception as e:
-                            logger.error("Error in on_connected: %s", e)
-
-                elif not is_connected and was_connected:
-                    logger.info("Network disconnected")
-                    self._current_ssid.set(None)
-                    if self.on_disconnected:
-                        try:
-                            self.on_disconnected()
-                        except Exception as e:
-                            logger.error("Error in on_disconnected: %s", e)
-
-                was_connected = is_connected
+        # Cleanup also runs if stop() cancels the task
+        try:
+            while self._running:
+                try:
+                    # Check connection status
+                    is_connected, has_internet, ssid = await self._tick()
+
+                    self._set_state(is_connected, has_internet)
+
+                    if is_connected:
+                        self._current_ssid.set(ssid)
+
+                    # Detect state changes
+                    if is_connected and not was_connected:
+                        logger.info("Network connected")
+                        if self.on_connected:
+                            try:
+                                self.on_connected()
+                            except Exception as e:
+                                logger.error("Error in on_connected: %s", e)
+
+                    elif not is_connected and was_connected:
+                        logger.info("Network disconnected")
+                        self._current_ssid.set(None)
+                        if self.on_disconnected:
+                            try:
+                                self.on_disconnected()
+                            except Exception as e:
+                                logger.error("Error in on_disconnected: %s", e)
+
+                    was_connected = is_connected
 
-            except Exception as e:
-                logger.error("Network monitor error: %s", e)
+                except Exception as e:
+                    logger.error("Network monitor error: %s", e)
 
-            thread.wait(5.0)  # Check every 5 seconds
+                # Check every 5 seconds, waking early on stop
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=5.0)
+                except TimeoutError:
+                    pass
+        finally:
+            await self._wifi.stop_monitor()
+            self._loop = None
+            logger.debug("Network monitor stopped")
+
+    async def _tick(self) -> tuple[bool, bool, str | None]:
+        """Query connection state for one monitor iteration.
+
+        Returns:
+            Tuple of (is_connected, has_internet, ssid)
+        """
+        is_connected = await self._wifi.is_connected()
+        if not is_connected:
+            return False, False, None
 
-        logger.debug("Network monitor stopped")
+        has_internet, ssid = await asyncio.gather(
+            self._check_internet(),
+            self._wifi.get_current_ssid(),
+        )
+        return True, has_internet, ssid
 
     async def _check_internet(self) -> bool:
         """Check if internet is accessible.
 
+        Results are cached for INTERNET_CHECK_TTL seconds.
+
         Returns:
             True if any connectivity endpoint responds
         """
+        cached = self._internet_cache
+        if cached and time.monotonic() - cached[0] < self.INTERNET_CHECK_TTL:
+            return cached[1]
+
         import httpx
 
+        result = False
         for url, expected_status in self.CONNECTIVITY_ENDPOINTS:
             try:
                 async with httpx.AsyncClient(timeout=5.0) as client:
                     response = await client.get(url, follow_redirects=False)
                     if response.status_code == expected_status:
-                        return True
+                        result = True
+                        break
             except Exception:
                 continue
 
-        return False
+        self._internet_cache = (time.monotonic(), result)
+        return result
+
+    def _invalidate_internet_cache(self) -> None:
+        """Force the next connectivity check to probe again."""
+        self._internet_cache = None
 
     async def _save_credentials(self, ssid: str, password: str) -> None:
         """Save WiFi credentials to config.
@@ -329,6 +546,10 @@ def get_network_manager() -> NetworkManager:
         NetworkManager singleton instance
     """
     global _network_manager
+    manager = _network_manager
+    if manager is not None:
+        return manager
+
     with _network_lock:
         if _network_manager is None:
             _network_manager = NetworkManager()
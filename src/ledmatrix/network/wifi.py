@@ -1,12 +1,17 @@
 """Secure WiFi management using NetworkManager/nmcli.
 
 Provides safe WiFi operations without shell injection vulnerabilities.
-Uses nmcli for all network operations (Trixie compatible).
+Uses nmcli for network operations (Trixie compatible), with scanning and
+connecting done over D-Bus when sdbus-networkmanager is installed.
 """
 
 import asyncio
+import contextlib
 import logging
 import re
+import time
+import weakref
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,6 +20,27 @@ from ..core.retry import async_retry, RetryConfig
 
 logger = logging.getLogger(__name__)
 
+# Try to import the D-Bus NetworkManager bindings
+try:
+    import sdbus
+    from sdbus_async.networkmanager import (
+        AccessPoint,
+        NetworkConnectionSettings,
+        NetworkDeviceWireless,
+        NetworkManagerSettings,
+    )
+    from sdbus_async.networkmanager import NetworkManager as NMProxy
+
+    SDBUS_AVAILABLE = True
+except ImportError:
+    sdbus = None
+    SDBUS_AVAILABLE = False
+    logger.info("sdbus-networkmanager not available, WiFi will use nmcli")
+
+# Backoff between checks for a requested scan to finish (seconds); the
+# total matches the fixed wait scans used before
+_SCAN_POLL_DELAYS = (0.2, 0.3, 0.5, 1.0)
+
 
 @dataclass
 class WiFiNetwork:
@@ -35,11 +61,154 @@ class WiFiNetwork:
         }
 
 
+class _DBusBackend:
+    """NetworkManager D-Bus client for scanning and connecting.
+
+    Talks to NetworkManager directly instead of forking nmcli, which
+    then makes the same D-Bus calls. sdbus binds a bus connection to
+    the event loop that first uses it, so one backend serves one loop.
+    """
+
+    # NM80211ApFlags / NM80211ApSecurityFlags bits
+    AP_FLAGS_PRIVACY = 0x1
+    SEC_KEY_MGMT_PSK = 0x100
+    SEC_KEY_MGMT_802_1X = 0x200
+    SEC_KEY_MGMT_SAE = 0x400
+
+    def __init__(self, interface: str) -> None:
+        """Open the system bus.
+
+        Args:
+            interface: WiFi interface name
+        """
+        self._interface = interface
+        self._bus = sdbus.sd_bus_open_system()
+        self._nm = NMProxy(self._bus)
+        self._settings = NetworkManagerSettings(self._bus)
+        self._device_path: str | None = None
+
+    async def _wireless(self) -> "NetworkDeviceWireless":
+        """Get the wireless device proxy for the interface."""
+        if self._device_path is None:
+            self._device_path = await self._nm.get_device_by_ip_iface(self._interface)
+        return NetworkDeviceWireless(self._device_path, self._bus)
+
+    @classmethod
+    def _security(cls, flags: int, wpa_flags: int, rsn_flags: int) -> str:
+        """Describe AP security the way nmcli's SECURITY field does.
+
+        Args:
+            flags: AP capability flags
+            wpa_flags: WPA1 security flags
+            rsn_flags: RSN (WPA2/WPA3) security flags
+
+        Returns:
+            Lowercase security string, "open" if unencrypted
+        """
+        parts = []
+        if flags & cls.AP_FLAGS_PRIVACY and not (wpa_flags or rsn_flags):
+            parts.append("wep")
+        if wpa_flags:
+            parts.append("wpa1")
+        if rsn_flags & (cls.SEC_KEY_MGMT_PSK | cls.SEC_KEY_MGMT_802_1X):
+            parts.append("wpa2")
+        if rsn_flags & cls.SEC_KEY_MGMT_SAE:
+            parts.append("wpa3")
+        if (wpa_flags | rsn_flags) & cls.SEC_KEY_MGMT_802_1X:
+            parts.append("802.1x")
+        return " ".join(parts) or "open"
+
+    async def scan(self) -> list[WiFiNetwork]:
+        """Request a scan and read the visible access points.
+
+        Returns:
+            Networks, strongest access point per SSID, unsorted
+        """
+        wireless = await self._wireless()
+        last_scan = await wireless.last_scan
+        try:
+            await wireless.request_scan({})
+        except Exception as e:
+            # Rejected while a scan is already running; use what NM has
+            logger.debug("Scan request rejected: %s", e)
+        else:
+            # LastScan is bumped when the scan completes
+            for delay in _SCAN_POLL_DELAYS:
+                await asyncio.sleep(delay)
+                if await wireless.last_scan != last_scan:
+                    break
+
+        ap_paths = await wireless.get_all_access_points()
+        active_path = await wireless.active_access_point
+        props = await asyncio.gather(
+            *(
+                AccessPoint(path, self._bus).properties_get_all_dict(on_unknown_member="ignore")
+                for path in ap_paths
+            )
+        )
+
+        best: dict[str, WiFiNetwork] = {}
+        for path, ap in zip(ap_paths, props, strict=True):
+            ssid = ap["ssid"].decode("utf-8", errors="replace")
+            if not ssid:
+                continue
+
+            network = WiFiNetwork(
+                ssid=ssid,
+                signal=ap["strength"],
+                security=self._security(ap["flags"], ap["wpa_flags"], ap["rsn_flags"]),
+                in_use=path == active_path,
+            )
+            current = best.get(ssid)
+            if current is None or network.in_use or (
+                not current.in_use and network.signal > current.signal
+            ):
+                best[ssid] = network
+
+        return list(best.values())
+
+    async def connect(self, ssid: str, password: str, connection_name: str) -> None:
+        """Replace the managed profile and activate it.
+
+        Args:
+            ssid: Network SSID
+            password: Network password (empty for open networks)
+            connection_name: Profile name for the managed connection
+        """
+        for path in await self._settings.get_connections_by_id(connection_name):
+            await NetworkConnectionSettings(path, self._bus).delete()
+
+        wireless = await self._wireless()
+
+        # Pointing NetworkManager at the AP lets it fill in key management
+        ap_path = "/"
+        for path in await wireless.get_all_access_points():
+            if await AccessPoint(path, self._bus).ssid == ssid.encode():
+                ap_path = path
+                break
+
+        profile: dict[str, dict[str, tuple[str, Any]]] = {
+            "connection": {
+                "id": ("s", connection_name),
+                "type": ("s", "802-11-wireless"),
+            },
+            "802-11-wireless": {"ssid": ("ay", ssid.encode())},
+        }
+        if password:
+            security = {"psk": ("s", password)}
+            if ap_path == "/":
+                security["key-mgmt"] = ("s", "wpa-psk")
+            profile["802-11-wireless-security"] = security
+
+        await self._nm.add_and_activate_connection(profile, self._device_path, ap_path)
+
+
 class WiFiManager:
     """Secure WiFi management using NetworkManager/nmcli.
 
-    All operations use nmcli with list arguments (no shell).
-    SSID and password validation prevents injection attacks.
+    All operations use nmcli with list arguments (no shell), or the
+    NetworkManager D-Bus API when available. SSID and password
+    validation prevents injection attacks.
 
     Usage:
         wifi = WiFiManager()
@@ -48,11 +217,30 @@ class WiFiManager:
     """
 
     # Regex for SSID validation (alphanumeric, spaces, common punctuation)
-    SSID_PATTERN = re.compile(r"^[\w\s\-\.\!\@\#\$\%\&\*\(\)]+$")
+    SSID_PATTERN = re.compile(r"^[\w \-.!@#$%&*()]+$")
+
+    # Regex for IPv4 addresses in nmcli output
+    IP4_PATTERN = re.compile(r"(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})")
 
     # Connection name prefix for managed connections
     CONNECTION_PREFIX = "led-display"
 
+    # How long scan results are reused before rescanning (seconds)
+    SCAN_CACHE_TTL = 20.0
+
+    # How long connect() waits for the device to come up, and how often
+    # it checks (seconds)
+    CONNECT_TIMEOUT = 10.0
+    CONNECT_POLL_INTERVAL = 0.5
+
+    # Max concurrent one-shot nmcli processes; they serialize on D-Bus anyway
+    MAX_NMCLI_PROCS = 2
+
+    # Shared across instances, one per event loop (semaphores are loop-bound)
+    _nmcli_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(self, interface: str = "wlan0") -> None:
         """Initialize WiFi manager.
 
@@ -62,6 +250,45 @@ class WiFiManager:
         self._interface = interface
         self._connection_name = f"{self.CONNECTION_PREFIX}-wifi"
 
+        # Last scan as (monotonic timestamp, networks)
+        self._scan_cache: tuple[float, list[WiFiNetwork]] | None = None
+
+        # Scan currently running, shared by concurrent callers on its loop
+        self._scan_inflight: asyncio.Future[list[WiFiNetwork]] | None = None
+
+        # Connection info kept current by `nmcli device monitor`; None
+        # while the monitor is not running
+        self._state_cache: dict[str, Any] | None = None
+        self._monitor_proc: asyncio.subprocess.Process | None = None
+        self._monitor_task: asyncio.Task | None = None
+
+        # D-Bus backends per event loop (sdbus buses are loop-bound)
+        self._dbus_backends: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _DBusBackend
+        ] = weakref.WeakKeyDictionary()
+        self._dbus_failed = False
+
+    def _get_dbus(self) -> _DBusBackend | None:
+        """Get the D-Bus backend for the running loop, connecting on first use.
+
+        Returns:
+            Backend or None if D-Bus is unavailable
+        """
+        if not SDBUS_AVAILABLE or self._dbus_failed:
+            return None
+
+        loop = asyncio.get_running_loop()
+        backend = self._dbus_backends.get(loop)
+        if backend is None:
+            try:
+                backend = _DBusBackend(self._interface)
+            except Exception as e:
+                logger.warning("D-Bus connection failed, using nmcli: %s", e)
+                self._dbus_failed = True
+                return None
+            self._dbus_backends[loop] = backend
+        return backend
+
     def _validate_ssid(self, ssid: str) -> None:
         """Validate SSID to prevent injection.
 
@@ -90,6 +317,19 @@ class WiFiManager:
         if password and len(password) > 63:
             raise NetworkError("Password too long (max 63 characters)")
 
+    @classmethod
+    def _nmcli_slot(cls) -> asyncio.Semaphore:
+        """Get the nmcli process limiter for the running loop.
+
+        Returns:
+            Semaphore bounding concurrent nmcli processes
+        """
+        loop = asyncio.get_running_loop()
+        sem = cls._nmcli_sems.get(loop)
+        if sem is None:
+            sem = cls._nmcli_sems[loop] = asyncio.Semaphore(cls.MAX_NMCLI_PROCS)
+        return sem
+
     async def _run_nmcli(
         self,
         *args: str,
@@ -112,17 +352,21 @@ class WiFiManager:
         cmd = ["nmcli", *args]
         logger.debug("Running: nmcli %s", " ".join(args))
 
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        async with self._nmcli_slot():
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
-        try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-        except asyncio.TimeoutError:
-            proc.kill()
-            raise NetworkError("nmcli command timed out", details={"args": args})
+            try:
+                async with asyncio.timeout(timeout):
+                    stdout, stderr = await proc.communicate()
+            except TimeoutError:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+                raise NetworkError("nmcli command timed out", details={"args": args})
 
         if check and proc.returncode != 0:
             error_msg = stderr.decode().strip() if stderr else "Unknown error"
@@ -133,63 +377,191 @@ class WiFiManager:
 
         return stdout.decode().strip() if stdout else ""
 
-    @async_retry(RetryConfig(max_attempts=2, base_delay=1.0))
-    async def scan_networks(self) -> list[WiFiNetwork]:
+    async def _stream_nmcli(self, *args: str, timeout: float = 30.0) -> AsyncIterator[str]:
+        """Run nmcli and yield its output line by line.
+
+        Lines are parsed as they arrive instead of buffering and
+        splitting the whole output. Iterate under contextlib.aclosing()
+        so that breaking out early kills nmcli right away.
+
+        Args:
+            *args: nmcli arguments
+            timeout: Command timeout in seconds, not counting time the
+                consumer spends between lines
+
+        Yields:
+            Output lines without trailing newline
+
+        Raises:
+            NetworkError: If the command fails or times out
+        """
+        logger.debug("Streaming: nmcli %s", " ".join(args))
+
+        async with self._nmcli_slot():
+            proc = await asyncio.create_subprocess_exec(
+                "nmcli",
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            assert proc.stdout is not None and proc.stderr is not None
+
+            # Drain stderr alongside stdout so nmcli never blocks on it
+            stderr_task = asyncio.ensure_future(proc.stderr.read())
+            loop = asyncio.get_running_loop()
+            remaining = timeout
+
+            try:
+                while True:
+                    started = loop.time()
+                    try:
+                        async with asyncio.timeout(remaining):
+                            raw = await proc.stdout.readline()
+                    except TimeoutError:
+                        raise NetworkError(
+                            "nmcli command timed out", details={"args": args}
+                        ) from None
+                    remaining -= loop.time() - started
+                    if not raw:
+                        break
+                    yield raw.decode().rstrip("\n")
+
+                try:
+                    async with asyncio.timeout(max(remaining, 0)):
+                        stderr = await stderr_task
+                        await proc.wait()
+                except TimeoutError:
+                    raise NetworkError(
+                        "nmcli command timed out", details={"args": args}
+                    ) from None
+            finally:
+                stderr_task.cancel()
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        proc.kill()
+                    await proc.wait()
+
+        if proc.returncode != 0:
+            error_msg = stderr.decode().strip() or "Unknown error"
+            raise NetworkError(
+                f"nmcli failed: {error_msg}",
+                details={"args": args, "returncode": proc.returncode},
+            )
+
+    def invalidate_scan_cache(self) -> None:
+        """Discard cached scan results so the next scan rescans."""
+        self._scan_cache = None
+
+    async def scan_networks(self, force: bool = False) -> list[WiFiNetwork]:
         """Scan for available WiFi networks.
 
+        Results are cached for SCAN_CACHE_TTL seconds, and concurrent
+        callers share a single in-flight scan.
+
+        Args:
+            force: Rescan even if cached results are still fresh
+
+        Returns:
+            List of discovered networks sorted by signal strength
+        """
+        cached = self._scan_cache
+        if not force and cached and time.monotonic() - cached[0] < self.SCAN_CACHE_TTL:
+            return list(cached[1])
+
+        # Join a scan already running on this loop. Futures are bound to
+        # their loop, so callers on other loops start their own scan.
+        loop = asyncio.get_running_loop()
+        inflight = self._scan_inflight
+        if inflight is not None and inflight.get_loop() is loop:
+            return list(await asyncio.shield(inflight))
+
+        future: asyncio.Future[list[WiFiNetwork]] = loop.create_future()
+        self._scan_inflight = future
+        try:
+            networks = await self._scan()
+            future.set_result(networks)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved if nobody else is waiting
+            raise
+        finally:
+            if self._scan_inflight is future:
+                self._scan_inflight = None
+
+        return list(networks)
+
+    @async_retry(RetryConfig(max_attempts=2, base_delay=1.0))
+    async def _scan(self) -> list[WiFiNetwork]:
+        """Run a WiFi scan and update the scan cache.
+
         Returns:
             List of discovered networks sorted by signal strength
         """
         logger.info("Scanning WiFi networks")
 
+        dbus = self._get_dbus()
+        if dbus is not None:
+            try:
+                networks = await dbus.scan()
+            except Exception as e:
+                logger.warning("D-Bus scan failed, using nmcli: %s", e)
+            else:
+                networks.sort(key=lambda n: n.signal, reverse=True)
+                logger.info("Found %d WiFi networks", len(networks))
+                self._scan_cache = (time.monotonic(), networks)
+                return networks
+
         # Force rescan
         await self._run_nmcli("device", "wifi", "rescan", check=False)
-        await asyncio.sleep(2)  # Wait for scan
+        await self._wait_for_scan()
+
+        networks: list[WiFiNetwork] = []
+        seen_ssids: set[str] = set()
 
         # Get network list
-        output = await self._run_nmcli(
+        stream = self._stream_nmcli(
             "-t",
             "-f",
             "SSID,SIGNAL,SECURITY,IN-USE",
             "device",
             "wifi",
             "list",
+            "--rescan",
+            "no",
         )
 
-        networks: list[WiFiNetwork] = []
-        seen_ssids: set[str] = set()
-
-        for line in output.split("\n"):
-            if not line.strip():
-                continue
-
-            # nmcli uses : as separator in terse mode
-            # Handle SSIDs that might contain colons
-            parts = line.split(":")
+        async with contextlib.aclosing(stream) as lines:
+            async for line in lines:
+                if not line.strip():
+                    continue
 
-            if len(parts) >= 4:
-                # Last three parts are signal, security, in-use
-                in_use = parts[-1] == "*"
-                security = parts[-2] if parts[-2] else "open"
+                # nmcli uses : as separator in terse mode; the last three
+                # fields are signal, security, in-use and the SSID may
+                # itself contain colons
                 try:
-                    signal = int(parts[-3]) if parts[-3] else 0
+                    ssid, signal_str, security, in_use_str = line.rsplit(":", 3)
                 except ValueError:
-                    signal = 0
-
-                # SSID is everything before the last 3 parts
-                ssid = ":".join(parts[:-3])
+                    continue
 
                 if not ssid or ssid in seen_ssids:
                     continue
 
                 seen_ssids.add(ssid)
 
+                try:
+                    signal = int(signal_str) if signal_str else 0
+                except ValueError:
+                    signal = 0
+
                 networks.append(
                     WiFiNetwork(
                         ssid=ssid,
                         signal=signal,
-                        security=security.lower().replace("wpa2", "wpa2").replace("wpa3", "wpa3"),
-                        in_use=in_use,
+                        security=security.lower() if security else "open",
+                        in_use=in_use_str == "*",
                     )
                 )
 
@@ -197,8 +569,29 @@ class WiFiManager:
         networks.sort(key=lambda n: n.signal, reverse=True)
 
         logger.info("Found %d WiFi networks", len(networks))
+        self._scan_cache = (time.monotonic(), networks)
         return networks
 
+    async def _wait_for_scan(self) -> None:
+        """Wait for a requested rescan to settle.
+
+        Polls the cached AP list with backoff and returns once two
+        consecutive polls see the same access points, instead of
+        always sleeping for the worst case.
+        """
+        previous = None
+        for delay in _SCAN_POLL_DELAYS:
+            await asyncio.sleep(delay)
+            try:
+                output = await self._run_nmcli(
+                    "-t", "-f", "BSSID", "device", "wifi", "list", "--rescan", "no"
+                )
+            except NetworkError:
+                return
+            if output and output == previous:
+                return
+            previous = output
+
     async def connect(self, ssid: str, password: str = "") -> bool:
         """Connect to a WiFi network securely.
 
@@ -216,45 +609,68 @@ class WiFiManager:
         logger.info("Connecting to WiFi: %s", ssid)
 
         try:
-            # Delete existing connection with this name
-            await self._run_nmcli("connection", "delete", self._connection_name, check=False)
-
-            # Create new connection
-            # nmcli properly handles argument escaping
-            if password:
-                await self._run_nmcli(
-                    "device",
-                    "wifi",
-                    "connect",
-                    ssid,
-                    "password",
-                    password,
-                    "name",
-                    self._connection_name,
-                )
-            else:
-                await self._run_nmcli(
-                    "device",
-                    "wifi",
-                    "connect",
-                    ssid,
-                    "name",
-                    self._connection_name,
-                )
-
-            # Verify connection
-            await asyncio.sleep(5)
-            if await self.is_connected():
-                logger.info("Successfully connected to %s", ssid)
-                return True
-            else:
+            await self._connect(ssid, password)
+
+            # Verify connection, returning as soon as the device is up on
+            # the new network. Activation is asynchronous, so the device
+            # may still report the previous network as connected at first.
+            try:
+                async with asyncio.timeout(self.CONNECT_TIMEOUT):
+                    while not await self._is_connected_to(ssid):
+                        await asyncio.sleep(self.CONNECT_POLL_INTERVAL)
+            except TimeoutError:
                 logger.warning("Connection to %s may have failed", ssid)
                 return False
 
+            logger.info("Successfully connected to %s", ssid)
+            self.invalidate_scan_cache()
+            return True
+
         except NetworkError as e:
             logger.error("Connection failed: %s", e)
             return False
 
+    async def _connect(self, ssid: str, password: str) -> None:
+        """Replace the managed connection profile and activate it.
+
+        Args:
+            ssid: Network SSID
+            password: Network password (empty for open networks)
+        """
+        dbus = self._get_dbus()
+        if dbus is not None:
+            try:
+                await dbus.connect(ssid, password, self._connection_name)
+                return
+            except Exception as e:
+                logger.warning("D-Bus connect failed, using nmcli: %s", e)
+
+        # Delete existing connection with this name
+        await self._run_nmcli("connection", "delete", self._connection_name, check=False)
+
+        # Create new connection
+        # nmcli properly handles argument escaping
+        if password:
+            await self._run_nmcli(
+                "device",
+                "wifi",
+                "connect",
+                ssid,
+                "password",
+                password,
+                "name",
+                self._connection_name,
+            )
+        else:
+            await self._run_nmcli(
+                "device",
+                "wifi",
+                "connect",
+                ssid,
+                "name",
+                self._connection_name,
+            )
+
     async def disconnect(self) -> None:
         """Disconnect from current WiFi network."""
         logger.info("Disconnecting WiFi")
@@ -266,11 +682,21 @@ class WiFiManager:
         Returns:
             True if connected
         """
-        try:
-            output = await self._run_nmcli("-t", "-f", "STATE", "device", "status")
-            return "connected" in output.lower()
-        except NetworkError:
-            return False
+        # Format: GENERAL.STATE:100 (connected)
+        fields = await self._device_show()
+        return fields.get("GENERAL.STATE", "").endswith("(connected)")
+
+    async def _is_connected_to(self, ssid: str) -> bool:
+        """Check if the interface is connected to a specific network.
+
+        Args:
+            ssid: Expected network SSID
+
+        Returns:
+            True if connected and the active network is ssid
+        """
+        info = await self._query_connection_info()
+        return info["connected"] and info["ssid"] == ssid
 
     async def get_current_ssid(self) -> str | None:
         """Get the SSID of the currently connected network.
@@ -305,28 +731,152 @@ class WiFiManager:
             for line in output.split("\n"):
                 if "IP4.ADDRESS" in line:
                     # Format: IP4.ADDRESS[1]:192.168.1.100/24
-                    match = re.search(r"(\d+\.\d+\.\d+\.\d+)", line)
+                    match = self.IP4_PATTERN.search(line)
                     if match:
                         return match.group(1)
             return None
         except NetworkError:
             return None
 
+    async def _device_show(self) -> dict[str, str]:
+        """Get state, connection and address of the interface in one call.
+
+        Returns:
+            Dict of nmcli field names to values (empty on error)
+        """
+        try:
+            output = await self._run_nmcli(
+                "-t",
+                "-f",
+                "GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS",
+                "device",
+                "show",
+                self._interface,
+            )
+        except NetworkError:
+            return {}
+
+        fields: dict[str, str] = {}
+        for line in output.split("\n"):
+            key, sep, value = line.partition(":")
+            if sep:
+                fields[key] = value
+        return fields
+
     async def get_connection_info(self) -> dict[str, Any]:
         """Get comprehensive connection information.
 
+        Served from the monitor's state cache while it is running,
+        otherwise queried from nmcli.
+
         Returns:
             Dict with connection details
         """
-        connected = await self.is_connected()
+        cached = self._state_cache
+        if cached is not None:
+            return dict(cached)
+        return await self._query_connection_info()
 
+    async def _query_connection_info(self) -> dict[str, Any]:
+        """Query connection information from nmcli.
+
+        Returns:
+            Dict with connection details
+        """
+        # Both queries run concurrently; the SSID is discarded if not connected
+        fields, ssid = await asyncio.gather(self._device_show(), self.get_current_ssid())
+
+        # Format: GENERAL.STATE:100 (connected)
+        connected = fields.get("GENERAL.STATE", "").endswith("(connected)")
+
+        ip_address = None
+        if connected:
+            # Format: IP4.ADDRESS[1]:192.168.1.100/24
+            match = self.IP4_PATTERN.search(fields.get("IP4.ADDRESS[1]", ""))
+            if match:
+                ip_address = match.group(1)
+
+        # GENERAL.CONNECTION is the profile name, not the SSID
         return {
             "connected": connected,
-            "ssid": await self.get_current_ssid() if connected else None,
-            "ip_address": await self.get_ip_address() if connected else None,
+            "ssid": ssid if connected else None,
+            "ip_address": ip_address,
             "interface": self._interface,
         }
 
+    async def start_monitor(self) -> None:
+        """Start watching the interface with a persistent nmcli process.
+
+        The connection info cache is refreshed whenever NetworkManager
+        reports a device state change, so get_connection_info() needs
+        no subprocess of its own. Must be stopped with stop_monitor()
+        on the same event loop.
+        """
+        if self._monitor_task is not None:
+            return
+
+        try:
+            self._monitor_proc = await asyncio.create_subprocess_exec(
+                "nmcli",
+                "device",
+                "monitor",
+                self._interface,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning("nmcli monitor unavailable: %s", e)
+            return
+
+        self._monitor_task = asyncio.create_task(self._watch_monitor(self._monitor_proc))
+
+    async def stop_monitor(self) -> None:
+        """Stop the nmcli monitor and drop the state cache."""
+        task, proc = self._monitor_task, self._monitor_proc
+        self._monitor_task = None
+        self._monitor_proc = None
+        self._state_cache = None
+
+        if proc is not None and proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _watch_monitor(self, proc: asyncio.subprocess.Process) -> None:
+        """Refresh the state cache on each burst of monitor events.
+
+        Args:
+            proc: Running `nmcli device monitor` process
+        """
+        assert proc.stdout is not None
+
+        try:
+            self._state_cache = await self._query_connection_info()
+
+            while await proc.stdout.readline():
+                # A connect or disconnect prints several state lines in
+                # quick succession; settle before querying once
+                try:
+                    while True:
+                        async with asyncio.timeout(0.5):
+                            if not await proc.stdout.readline():
+                                break
+                except TimeoutError:
+                    pass
+
+                self._state_cache = await self._query_connection_info()
+        finally:
+            # Fall back to one-shot queries if the monitor dies
+            self._state_cache = None
+            if self._monitor_proc is proc:
+                logger.warning("nmcli monitor exited, using direct queries")
+
     async def forget_network(self, connection_name: str | None = None) -> None:
         """Forget a saved network.
 
@@ -354,10 +904,10 @@ class WiFiManager:
 
             connections = []
             for line in output.split("\n"):
-                if ":802-11-wireless" in line or ":wifi" in line:
-                    name = line.split(":")[0]
-                    if name:
-                        connections.append(name)
+                # TYPE is the last field; terse mode escapes colons in NAME
+                name, _, conn_type = line.rpartition(":")
+                if name and conn_type in ("802-11-wireless", "wifi"):
+                    connections.append(name.replace("\\:", ":"))
 
             return connections
         except NetworkError:
@@ -3,13 +3,25 @@
 Provides REST API and web UI for device configuration.
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
+import os
+from collections.abc import AsyncIterator
 from pathlib import Path
+from urllib.parse import parse_qs
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from ..core.config import get_config_manager
 from .auth import (
@@ -19,6 +31,7 @@ from .auth import (
     RateLimiter,
     RateLimitMiddleware,
 )
+from .responses import ORJSONResponse
 from .routes import api_router, apps_router, wifi_router
 
 logger = logging.getLogger(__name__)
@@ -26,6 +39,92 @@ logger = logging.getLogger(__name__)
 # Module directory for templates/static
 MODULE_DIR = Path(__file__).parent
 
+# Compiled template bytecode, kept across restarts
+TEMPLATE_CACHE_DIR = Path("/var/cache/led-display/jinja")
+
+STATIC_DIR = MODULE_DIR / "static"
+
+# Static file content hashes: {real path: (mtime, etag)}
+_etag_cache: dict[str, tuple[float, str]] = {}
+
+
+def _file_etag(full_path: str, mtime: float) -> str:
+    """Get the content hash of a static file, re-hashing only on change.
+
+    Args:
+        full_path: Resolved file path
+        mtime: Current modification time of the file
+
+    Returns:
+        Hex MD5 digest of the file contents
+    """
+    cached = _etag_cache.get(full_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(full_path, "rb") as f:
+        etag = hashlib.md5(f.read(), usedforsecurity=False).hexdigest()
+    _etag_cache[full_path] = (mtime, etag)
+    return etag
+
+
+def static_url(path: str) -> str:
+    """Build a versioned URL for a static asset.
+
+    The content hash in the query string lets CachedStaticFiles mark
+    the response immutable; a changed file gets a new URL.
+
+    Args:
+        path: Path relative to the static directory
+
+    Returns:
+        URL such as /static/css/style.css?v=1a2b3c4d5e6f
+    """
+    full_path = os.path.realpath(STATIC_DIR / path)
+    etag = _file_etag(full_path, os.stat(full_path).st_mtime)
+    return f"/static/{path}?v={etag[:12]}"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with cached content ETags and long-lived caching.
+
+    Requests for versioned URLs (see static_url) are cacheable for a
+    year; anything else must be revalidated.
+    """
+
+    def file_response(
+        self,
+        full_path: os.PathLike | str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        etag = _file_etag(str(full_path), stat_result.st_mtime)
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        response.headers["etag"] = f'"{etag}"'
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if "v" in query:
+            response.headers["cache-control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["cache-control"] = "no-cache"
+
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run background maintenance for as long as the app is served."""
+    cleanup = asyncio.create_task(app.state.session_manager.cleanup_loop())
+    try:
+        yield
+    finally:
+        cleanup.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await cleanup
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
@@ -41,6 +140,8 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/api/docs" if not config.web.require_auth else None,
         redoc_url=None,
+        default_response_class=ORJSONResponse,
+        lifespan=_lifespan,
     )
 
     # Initialize components
@@ -56,78 +157,107 @@ def create_app() -> FastAPI:
     app.add_middleware(AuthMiddleware, session_manager=session_manager)
 
     # Mount static files
-    static_dir = MODULE_DIR / "static"
-    if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    if STATIC_DIR.exists():
+        app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
 
     # Setup templates
     templates_dir = MODULE_DIR / "templates"
     templates = None
     if templates_dir.exists():
         templates = Jinja2Templates(directory=str(templates_dir))
+        _tune_template_env(templates)
+        templates.env.globals["static_url"] = static_url
 
     # Include API routers
     app.include_router(api_router)
     app.include_router(apps_router)
     app.include_router(wifi_router)
 
-    # Web UI routes
-    @app.get("/", response_class=HTMLResponse)
-    async def index(request: Request):
-        """Dashboard page."""
-        if templates:
-            return templates.TemplateResponse("index.html", {"request": request})
-        return _minimal_dashboard()
+    # Web UI routes, chosen once depending on whether templates are installed
+    if templates is not None:
+
+        @functools.cache
+        def rendered_page(name: str) -> tuple[bytes, str]:
+            """Render a page once; templates take no per-request context."""
+            return _static_page(templates.get_template(name).render())
+
+        @app.get("/", response_class=HTMLResponse)
+        async def index(request: Request):
+            """Dashboard page."""
+            return _page_response(request, rendered_page("index.html"))
+
+        @app.get("/apps", response_class=HTMLResponse)
+        async def apps_page(request: Request):
+            """Apps management page."""
+            return _page_response(request, rendered_page("apps.html"))
+
+        @app.get("/wifi", response_class=HTMLResponse)
+        async def wifi_page(request: Request):
+            """WiFi configuration page."""
+            return _page_response(request, rendered_page("wifi.html"))
+
+        @app.get("/system", response_class=HTMLResponse)
+        async def system_page(request: Request):
+            """System settings page."""
+            return _page_response(request, rendered_page("system.html"))
+
+    else:
+
+        @app.get("/", response_class=HTMLResponse)
+        async def index(request: Request):
+            """Dashboard page."""
+            return _page_response(request, _DASHBOARD_PAGE)
+
+        @app.get("/apps")
+        @app.get("/wifi")
+        @app.get("/system")
+        async def page_unavailable() -> RedirectResponse:
+            """Template-only pages fall back to the dashboard."""
+            return RedirectResponse(url="/")
 
     @app.get("/login", response_class=HTMLResponse)
     async def login_page(request: Request):
         """Login page."""
-        config = get_config_manager().get()
-
         # If no password set, redirect to setup
-        if not config.web.admin_password_hash:
+        if not get_config_manager().get().web.admin_password_hash:
             return RedirectResponse(url="/setup", status_code=303)
 
-        return _minimal_login_page()
+        return _page_response(request, _LOGIN_PAGE)
 
     @app.get("/setup", response_class=HTMLResponse)
     async def setup_page(request: Request):
         """Initial setup page."""
-        config = get_config_manager().get()
-
         # If password already set, redirect to login
-        if config.web.admin_password_hash:
+        if get_config_manager().get().web.admin_password_hash:
             return RedirectResponse(url="/login", status_code=303)
 
-        return _minimal_setup_page()
-
-    @app.get("/apps", response_class=HTMLResponse)
-    async def apps_page(request: Request):
-        """Apps management page."""
-        if templates:
-            return templates.TemplateResponse("apps.html", {"request": request})
-        return RedirectResponse(url="/")
-
-    @app.get("/wifi", response_class=HTMLResponse)
-    async def wifi_page(request: Request):
-        """WiFi configuration page."""
-        if templates:
-            return templates.TemplateResponse("wifi.html", {"request": request})
-        return RedirectResponse(url="/")
-
-    @app.get("/system", response_class=HTMLResponse)
-    async def system_page(request: Request):
-        """System settings page."""
-        if templates:
-            return templates.TemplateResponse("system.html", {"request": request})
-        return RedirectResponse(url="/")
+        return _page_response(request, _SETUP_PAGE)
 
     return app
 
 
-def _minimal_dashboard() -> HTMLResponse:
+def _tune_template_env(templates: Jinja2Templates) -> None:
+    """Configure the Jinja environment for a read-only install.
+
+    Templates never change at runtime, so skip the per-render source
+    stat and persist compiled bytecode so restarts don't recompile.
+
+    Args:
+        templates: Templates instance to configure
+    """
+    env = templates.env
+    env.auto_reload = False
+
+    try:
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        env.bytecode_cache = FileSystemBytecodeCache(directory=str(TEMPLATE_CACHE_DIR))
+    except OSError as e:
+        logger.warning("Template bytecode cache disabled: %s", e)
+
+
+def _minimal_dashboard() -> str:
     """Minimal dashboard when templates not available."""
-    return HTMLResponse("""
+    return """
     <!DOCTYPE html>
     <html>
     <head>
@@ -201,9 +331,15 @@ def _minimal_dashboard() -> HTMLResponse:
         </div>
 
         <script>
+            let lastEtag = null;
+
             async function loadStatus() {
                 try {
-                    const resp = await fetch('/api/status');
+                    const resp = await fetch('/api/status', {
+                        headers: lastEtag ? { 'If-None-Match': lastEtag } : {}
+                    });
+                    if (resp.status === 304) return;
+                    lastEtag = resp.headers.get('ETag');
                     const data = await resp.json();
                     document.getElementById('current-app').textContent = data.active_app || 'None';
                     document.getElementById('brightness').value = data.brightness;
@@ -239,12 +375,12 @@ def _minimal_dashboard() -> HTMLResponse:
         </script>
     </body>
     </html>
-    """)
+    """
 
 
-def _minimal_login_page() -> HTMLResponse:
+def _minimal_login_page() -> str:
     """Minimal login page."""
-    return HTMLResponse("""
+    return """
     <!DOCTYPE html>
     <html>
     <head>
@@ -332,12 +468,12 @@ def _minimal_login_page() -> HTMLResponse:
         </script>
     </body>
     </html>
-    """)
+    """
 
 
-def _minimal_setup_page() -> HTMLResponse:
+def _minimal_setup_page() -> str:
     """Minimal initial setup page."""
-    return HTMLResponse("""
+    return """
     <!DOCTYPE html>
     <html>
     <head>
@@ -440,20 +576,50 @@ def _minimal_setup_page() -> HTMLResponse:
         </script>
     </body>
     </html>
-    """)
+    """
+
+
+def _static_page(html: str) -> tuple[bytes, str]:
+    """Encode a static page once and derive its ETag.
+
+    Args:
+        html: Page markup
+
+    Returns:
+        Tuple of (UTF-8 body, quoted ETag)
+    """
+    body = html.encode("utf-8")
+    return body, f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
 
 
-# Global app instance
-_app: FastAPI | None = None
+# Pre-encoded fallback pages, built once at import time
+_DASHBOARD_PAGE = _static_page(_minimal_dashboard())
+_LOGIN_PAGE = _static_page(_minimal_login_page())
+_SETUP_PAGE = _static_page(_minimal_setup_page())
+
+
+def _page_response(request: Request, page: tuple[bytes, str]) -> Response:
+    """Serve a pre-encoded page, answering 304 when the client copy is current.
+
+    Args:
+        request: Incoming request
+        page: Tuple of (body, ETag) from _static_page
+
+    Returns:
+        200 response with the page body, or an empty 304
+    """
+    body, etag = page
+    headers = {"cache-control": "no-cache", "etag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
 
 
+@functools.cache
 def get_app() -> FastAPI:
     """Get or create the FastAPI application.
 
     Returns:
         FastAPI application instance
     """
-    global _app
-    if _app is None:
-        _app = create_app()
-    return _app
+    return create_app()
@@ -6,24 +6,35 @@ Provides secure session-based authentication with:
 - CSRF protection
 """
 
+import asyncio
 import hashlib
 import hmac
 import logging
 import secrets
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 from fastapi import HTTPException, Request, Response
+from fastapi.responses import RedirectResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from ..core.config import get_config_manager
 
 logger = logging.getLogger(__name__)
 
+# PBKDF2 parameters shared by hashing and verification
+_PBKDF2_ITERATIONS = 100000
+_PBKDF2_KEY_LENGTH = 32
+
 
 @dataclass
 class Session:
-    """User session data."""
+    """User session data.
+
+    Timestamps come from time.monotonic(), so NTP corrections at boot
+    neither expire nor prolong sessions.
+    """
 
     token: str
     created_at: float
@@ -32,16 +43,25 @@ class Session:
 
 
 class SessionManager:
-    """Manages user sessions with secure tokens."""
+    """Manages user sessions with secure tokens.
 
-    def __init__(self, lifetime: int = 86400) -> None:
+    Sessions are kept in expiry order (all share one lifetime and are
+    moved to the end when extended), so expired ones are always at
+    the front.
+    """
+
+    CLEANUP_INTERVAL = 60  # Seconds between expired-session sweeps
+
+    def __init__(self, lifetime: int = 86400, max_sessions: int = 10000) -> None:
         """Initialize session manager.
 
         Args:
             lifetime: Session lifetime in seconds (default: 24 hours)
+            max_sessions: Sessions kept before the oldest are evicted
         """
-        self._sessions: dict[str, Session] = {}
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
         self._lifetime = lifetime
+        self._max = max_sessions
 
     def create_session(self, ip_address: str) -> str:
         """Create a new session.
@@ -53,7 +73,7 @@ class SessionManager:
             Session token
         """
         token = secrets.token_urlsafe(32)
-        now = time.time()
+        now = time.monotonic()
 
         self._sessions[token] = Session(
             token=token,
@@ -62,7 +82,10 @@ class SessionManager:
             ip_address=ip_address,
         )
 
-        self._cleanup_expired()
+        # Expired sessions are swept by cleanup_loop(); only enforce capacity here
+        if len(self._sessions) > self._max:
+            self._sessions.popitem(last=False)
+
         logger.debug("Created session for %s", ip_address)
 
         return token
@@ -81,7 +104,7 @@ class SessionManager:
         if not session:
             return False
 
-        if time.time() > session.expires_at:
+        if time.monotonic() > session.expires_at:
             del self._sessions[token]
             return False
 
@@ -103,54 +126,94 @@ class SessionManager:
         """
         session = self._sessions.get(token)
         if session:
-            session.expires_at = time.time() + self._lifetime
+            session.expires_at = time.monotonic() + self._lifetime
+            self._sessions.move_to_end(token)
 
-    def _cleanup_expired(self) -> None:
-        """Remove expired sessions."""
-        now = time.time()
-        expired = [t for t, s in self._sessions.items() if now > s.expires_at]
-        for token in expired:
-            del self._sessions[token]
+    async def cleanup_loop(self) -> None:
+        """Periodically remove expired sessions until cancelled."""
+        while True:
+            await asyncio.sleep(self.CLEANUP_INTERVAL)
+            self._cleanup_expired()
 
-
-def hash_password(password: str, salt: str | None = None) -> tuple[str, str]:
+    def _cleanup_expired(self) -> None:
+        """Remove expired sessions and evict the oldest beyond capacity."""
+        now = time.monotonic()
+        sessions = self._sessions
+        while sessions:
+            oldest = next(iter(sessions.values()))
+            if now <= oldest.expires_at and len(sessions) <= self._max:
+                break
+            sessions.popitem(last=False)
+
+
+def hash_password(
+    password: str, salt: bytes | None = None, algorithm: str = "sha512"
+) -> tuple[bytes, bytes]:
     """Hash a password using PBKDF2.
 
+    Works on bytes end to end; the hash is hex-encoded and the salt
+    decoded as ASCII only when written to the config file. SHA-512 is
+    the default PRF since it runs faster per round on 64-bit CPUs;
+    "sha256" verifies hashes stored before the switch.
+
     Args:
         password: Plain text password
         salt: Optional salt (generated if not provided)
+        algorithm: PBKDF2 hash name
 
     Returns:
-        Tuple of (hash, salt)
+        Tuple of (raw 32-byte hash, salt)
     """
     if salt is None:
-        salt = secrets.token_hex(16)
+        salt = secrets.token_hex(16).encode()
 
     hashed = hashlib.pbkdf2_hmac(
-        "sha256",
+        algorithm,
         password.encode(),
-        salt.encode(),
-        iterations=100000,
-    ).hex()
+        salt,
+        iterations=_PBKDF2_ITERATIONS,
+        dklen=_PBKDF2_KEY_LENGTH,
+    )
 
     return hashed, salt
 
 
-def verify_password(password: str, stored_hash: str, salt: str) -> bool:
+def verify_password(
+    password: str, stored_hash: bytes, salt: bytes, algorithm: str = "sha512"
+) -> bool:
     """Verify a password against stored hash.
 
     Args:
         password: Plain text password to verify
-        stored_hash: Stored password hash
+        stored_hash: Stored raw password hash
         salt: Password salt
+        algorithm: PBKDF2 hash name the stored hash was derived with
 
     Returns:
         True if password matches
     """
-    computed_hash, _ = hash_password(password, salt)
+    computed_hash = hashlib.pbkdf2_hmac(
+        algorithm, password.encode(), salt, _PBKDF2_ITERATIONS, _PBKDF2_KEY_LENGTH
+    )
     return hmac.compare_digest(computed_hash, stored_hash)
 
 
+def get_client_ip(request: Request) -> str:
+    """Get the client's IP address.
+
+    Reads the ASGI scope directly rather than building an Address
+    through request.client. Also usable as a FastAPI dependency.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client IP, or "unknown" if the server didn't report one
+    """
+    client = request.scope.get("client")
+    return client[0] if client else "unknown"
+
+
 class AuthMiddleware(BaseHTTPMiddleware):
     """Authentication middleware for FastAPI.
 
@@ -159,34 +222,41 @@ class AuthMiddleware(BaseHTTPMiddleware):
     """
 
     # Paths that don't require authentication
-    PUBLIC_PATHS = {
-        "/api/health",
-        "/login",
-        "/api/auth/login",
-        "/api/auth/setup",
-        "/static",
-        "/favicon.ico",
-    }
+    PUBLIC_PATHS = frozenset(
+        {
+            "/api/health",
+            "/login",
+            "/api/auth/login",
+            "/api/auth/setup",
+            "/static",
+            "/favicon.ico",
+        }
+    )
 
     # Captive portal detection paths (always public)
-    CAPTIVE_PATHS = {
-        "/generate_204",
-        "/gen_204",
-        "/hotspot-detect.html",
-        "/library/test/success.html",
-        "/connecttest.txt",
-        "/ncsi.txt",
-    }
+    CAPTIVE_PATHS = frozenset(
+        {
+            "/generate_204",
+            "/gen_204",
+            "/hotspot-detect.html",
+            "/library/test/success.html",
+            "/connecttest.txt",
+            "/ncsi.txt",
+        }
+    )
 
     def __init__(self, app, session_manager: SessionManager) -> None:
         super().__init__(app)
         self.session_manager = session_manager
 
+        # Public paths are prefixes; a tuple lets one startswith() check them all
+        self._public_prefixes = tuple(self.PUBLIC_PATHS)
+
     async def dispatch(self, request: Request, call_next):
         # Allow public paths
         path = request.url.path
 
-        if any(path.startswith(p) for p in self.PUBLIC_PATHS):
+        if path.startswith(self._public_prefixes):
             return await call_next(request)
 
         if path in self.CAPTIVE_PATHS:
@@ -204,7 +274,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         # Validate session
         session_token = request.cookies.get("session")
-        client_ip = request.client.host if request.client else "unknown"
+        client_ip = get_client_ip(request)
 
         if session_token and self.session_manager.validate_session(session_token, client_ip):
             # Extend session on activity
@@ -215,28 +285,21 @@ class AuthMiddleware(BaseHTTPMiddleware):
         if path.startswith("/api"):
             raise HTTPException(status_code=401, detail="Not authenticated")
         else:
-            from fastapi.responses import RedirectResponse
-
             return RedirectResponse(url="/login", status_code=303)
 
 
 class CSRFMiddleware(BaseHTTPMiddleware):
     """CSRF protection middleware."""
 
-    SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
     TOKEN_HEADER = "X-CSRF-Token"
     TOKEN_COOKIE = "csrf_token"
 
     async def dispatch(self, request: Request, call_next):
-        # Generate CSRF token if not present
-        csrf_token = request.cookies.get(self.TOKEN_COOKIE)
-        if not csrf_token:
-            csrf_token = secrets.token_urlsafe(32)
+        cookie_token = request.cookies.get(self.TOKEN_COOKIE)
 
         # Validate token for unsafe methods
         if request.method not in self.SAFE_METHODS:
-            cookie_token = request.cookies.get(self.TOKEN_COOKIE)
-
             if not cookie_token:
                 # First request - set token but don't require it
                 pass
@@ -244,10 +307,15 @@ class CSRFMiddleware(BaseHTTPMiddleware):
                 # Check header token
                 header_token = request.headers.get(self.TOKEN_HEADER)
 
-                # Also check form data for traditional forms
+                # Also check form data for traditional forms. The API only
+                # takes JSON with the header token, so its bodies are never
+                # parsed here.
                 form_token = None
                 content_type = request.headers.get("content-type", "")
-                if "application/x-www-form-urlencoded" in content_type:
+                if (
+                    not request.url.path.startswith("/api/")
+                    and "application/x-www-form-urlencoded" in content_type
+                ):
                     try:
                         form = await request.form()
                         form_token = form.get("csrf_token")
@@ -261,20 +329,25 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
         response = await call_next(request)
 
-        # Set CSRF cookie
-        response.set_cookie(
-            self.TOKEN_COOKIE,
-            csrf_token,
-            httponly=True,
-            samesite="strict",
-            max_age=3600,
-        )
+        # Issue a CSRF token only to clients that don't have one yet
+        if not cookie_token:
+            response.set_cookie(
+                self.TOKEN_COOKIE,
+                secrets.token_urlsafe(32),
+                httponly=True,
+                samesite="strict",
+                max_age=3600,
+            )
 
         return response
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter."""
+    """Simple in-memory token-bucket rate limiter.
+
+    Each client holds up to requests_per_minute tokens, refilled
+    continuously; running dry blocks the client for block_duration.
+    """
 
     def __init__(
         self,
@@ -283,7 +356,9 @@ class RateLimiter:
     ) -> None:
         self.per_minute = requests_per_minute
         self.block_duration = block_duration
-        self._requests: dict[str, list[float]] = {}
+        self._rate = requests_per_minute / 60.0
+        # Per client: (tokens left, time of last refill)
+        self._buckets: dict[str, tuple[float, float]] = {}
         self._blocked: dict[str, float] = {}
 
     def check(self, client_ip: str) -> tuple[bool, str | None]:
@@ -295,7 +370,7 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, error_message)
         """
-        now = time.time()
+        now = time.monotonic()
 
         # Check if blocked
         if client_ip in self._blocked:
@@ -305,21 +380,18 @@ class RateLimiter:
             else:
                 del self._blocked[client_ip]
 
-        # Get request history
-        if client_ip not in self._requests:
-            self._requests[client_ip] = []
-
-        # Clean old requests
-        minute_ago = now - 60
-        self._requests[client_ip] = [t for t in self._requests[client_ip] if t > minute_ago]
+        # Refill the bucket for the time since the last request
+        tokens, last = self._buckets.get(client_ip, (self.per_minute, now))
+        tokens = min(self.per_minute, tokens + (now - last) * self._rate)
 
         # Check rate
-        if len(self._requests[client_ip]) >= self.per_minute:
+        if tokens < 1:
+            self._buckets[client_ip] = (tokens, now)
             self._blocked[client_ip] = now + self.block_duration
             return False, "Too many requests"
 
         # Record request
-        self._requests[client_ip].append(now)
+        self._buckets[client_ip] = (tokens - 1, now)
         return True, None
 
 
@@ -331,7 +403,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.rate_limiter = rate_limiter
 
     async def dispatch(self, request: Request, call_next):
-        client_ip = request.client.host if request.client else "unknown"
+        client_ip = get_client_ip(request)
 
         allowed, error = self.rate_limiter.check(client_ip)
         if not allowed:
@@ -0,0 +1,17 @@
+"""Response classes for the web API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    Several times faster than the stdlib encoder and emits compact
+    output, which matters for the endpoints the UI polls.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
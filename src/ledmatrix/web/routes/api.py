@@ -3,12 +3,17 @@
 Provides system status, health checks, and general API endpoints.
 """
 
+import asyncio
+import hashlib
 import logging
 import time
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from ...apps import get_app_scheduler
 from ...core.config import get_config_manager
+from ...display import get_display_manager
+from ...network import get_network_manager
 from ..schemas import (
     APIResponse,
     StatusResponse,
@@ -17,14 +22,19 @@ from ..schemas import (
     LoginRequest,
     SetupPasswordRequest,
 )
-from ..auth import SessionManager, hash_password, verify_password
+from ..auth import SessionManager, get_client_ip, hash_password, verify_password
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["api"])
 
 # Track start time for uptime
-_start_time = time.time()
+_start_time = time.monotonic()
+
+# Encoded status reused by pollers while nothing they can change has moved:
+# (key, built at, body, etag). Network state and uptime may lag by the TTL.
+_STATUS_TTL = 1.0
+_status_cache: tuple[tuple, float, bytes, str] | None = None
 
 
 def get_session_manager(request: Request) -> SessionManager:
@@ -38,39 +48,72 @@ async def health_check() -> APIResponse:
     return APIResponse(success=True, message="OK")
 
 
-@router.get("/status")
-async def get_status(request: Request) -> StatusResponse:
-    """Get system status."""
-    from ...apps import get_app_scheduler
-    from ...display import get_display_manager
-    from ...network import get_network_manager
+def _status_etag(status: StatusResponse) -> str:
+    """Derive the ETag for a status snapshot.
 
-    scheduler = get_app_scheduler()
-    display = get_display_manager()
-    network = get_network_manager()
+    Uptime only counts toward it in whole minutes, the resolution the UI
+    shows, so an idle display keeps answering polls with 304.
 
-    config = get_config_manager().get()
+    Args:
+        status: Status snapshot
 
-    # Get network info (async)
-    import asyncio
+    Returns:
+        Quoted ETag
+    """
+    digest = hashlib.blake2b(
+        status.model_dump_json(exclude={"uptime"}).encode(), digest_size=8
+    )
+    digest.update(int(status.uptime // 60).to_bytes(8, "little"))
+    return f'"{digest.hexdigest()}"'
 
-    network_info = asyncio.run(network.get_connection_info())
 
-    return StatusResponse(
-        active_app=scheduler.active_app_name if scheduler else None,
-        brightness=display.brightness,
-        rotation_enabled=config.apps.rotation_enabled,
-        rotation_interval=config.apps.rotation_interval,
-        network=network_info,
-        uptime=time.time() - _start_time,
-    )
+@router.get("/status", response_model=StatusResponse)
+async def get_status(request: Request) -> Response:
+    """Get system status.
+
+    Answers 304 when the client's If-None-Match is still current.
+    """
+    global _status_cache
+
+    scheduler = get_app_scheduler()
+    display = get_display_manager()
+    config_manager = get_config_manager()
+
+    active_app = scheduler.active_app_name if scheduler else None
+    key = (active_app, display.brightness, config_manager.version)
+    now = time.monotonic()
+
+    cached = _status_cache
+    if cached is None or cached[0] != key or now - cached[1] >= _STATUS_TTL:
+        config = config_manager.get()
+        network_info = await get_network_manager().get_connection_info()
+
+        # Every field comes from typed internal state; skip revalidation
+        status = StatusResponse.model_construct(
+            active_app=active_app,
+            brightness=display.brightness,
+            rotation_enabled=config.apps.rotation_enabled,
+            rotation_interval=config.apps.rotation_interval,
+            network=network_info,
+            uptime=now - _start_time,
+        )
+        cached = _status_cache = (
+            key,
+            now,
+            status.model_dump_json().encode(),
+            _status_etag(status),
+        )
+
+    _, _, body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"etag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"etag": etag})
 
 
 @router.post("/display/brightness")
 async def set_brightness(request: BrightnessRequest) -> APIResponse:
     """Set display brightness."""
-    from ...display import get_display_manager
-
     display = get_display_manager()
     display.set_brightness(request.brightness)
 
@@ -90,8 +133,6 @@ async def set_brightness(request: BrightnessRequest) -> APIResponse:
 @router.post("/display/test")
 async def test_display() -> APIResponse:
     """Run display test pattern."""
-    from ...display import get_display_manager
-
     display = get_display_manager()
     display.draw_test_pattern()
 
@@ -101,8 +142,6 @@ async def test_display() -> APIResponse:
 @router.post("/rotation")
 async def set_rotation(request: RotationRequest) -> APIResponse:
     """Configure app rotation."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if scheduler:
         scheduler.set_rotation(request.enabled, request.interval)
@@ -125,27 +164,24 @@ async def set_rotation(request: RotationRequest) -> APIResponse:
 
 @router.post("/auth/login")
 async def login(
-    request: Request,
     response: Response,
     body: LoginRequest,
     session_manager: SessionManager = Depends(get_session_manager),
+    client_ip: str = Depends(get_client_ip),
 ) -> APIResponse:
     """Authenticate and create session."""
     config = get_config_manager().get()
 
-    if not config.web.admin_password_hash or not config.web.admin_password_salt:
+    stored = config.web.admin_password_bytes
+    if stored is None:
         raise HTTPException(status_code=400, detail="Password not configured")
 
-    if not verify_password(
-        body.password.get_secret_value(),
-        config.web.admin_password_hash,
-        config.web.admin_password_salt,
-    ):
-        logger.warning("Failed login attempt from %s", request.client.host if request.client else "unknown")
+    # PBKDF2 releases the GIL; run it off the event loop
+    if not await asyncio.to_thread(verify_password, body.password, *stored):
+        logger.warning("Failed login attempt from %s", client_ip)
         raise HTTPException(status_code=401, detail="Invalid password")
 
     # Create session
-    client_ip = request.client.host if request.client else "unknown"
     token = session_manager.create_session(client_ip)
 
     # Set cookie
@@ -188,7 +224,7 @@ async def setup_password(body: SetupPasswordRequest) -> APIResponse:
         raise HTTPException(status_code=400, detail="Password already configured")
 
     # Hash and save password
-    password_hash, salt = hash_password(body.password.get_secret_value())
+    password_hash, salt = await asyncio.to_thread(hash_password, body.password)
     config_manager.set_admin_password(password_hash, salt)
 
     logger.info("Admin password configured")
@@ -199,15 +235,12 @@ async def setup_password(body: SetupPasswordRequest) -> APIResponse:
 @router.post("/system/restart")
 async def restart_service() -> APIResponse:
     """Restart the LED display service."""
-    import asyncio
-    import subprocess
-
     logger.warning("Service restart requested")
 
     # Restart asynchronously
     async def do_restart():
         await asyncio.sleep(1)
-        subprocess.Popen(["sudo", "systemctl", "restart", "led-display"])
+        await asyncio.create_subprocess_exec("sudo", "systemctl", "restart", "led-display")
 
     asyncio.create_task(do_restart())
 
@@ -217,14 +250,11 @@ async def restart_service() -> APIResponse:
 @router.post("/system/reboot")
 async def reboot_system() -> APIResponse:
     """Reboot the Raspberry Pi."""
-    import asyncio
-    import subprocess
-
     logger.warning("System reboot requested")
 
     async def do_reboot():
         await asyncio.sleep(2)
-        subprocess.Popen(["sudo", "reboot"])
+        await asyncio.create_subprocess_exec("sudo", "reboot")
 
     asyncio.create_task(do_reboot())
 
@@ -3,10 +3,13 @@
 Provides endpoints for listing, configuring, and switching apps.
 """
 
+import hashlib
 import logging
+import time
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from ...apps import AppScheduler, get_app_scheduler
 from ...core.config import get_config_manager
 from ..schemas import (
     APIResponse,
@@ -21,38 +24,61 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/apps", tags=["apps"])
 
+# Encoded apps list reused between polls: (key, built at, body, etag). The
+# key covers the scheduler, active app and config version; the TTL bounds
+# staleness from app changes that do not bump the config version.
+_APPS_TTL = 1.0
+_apps_cache: tuple[tuple[int, str | None, int], float, bytes, str] | None = None
 
-@router.get("")
-async def list_apps() -> AppsListResponse:
-    """List all registered apps with their configuration."""
-    from ...apps import get_app_scheduler
+
+@router.get("", response_model=AppsListResponse)
+async def list_apps(request: Request) -> Response:
+    """List all registered apps with their configuration.
+
+    The encoded list is reused for up to a second while the scheduler,
+    active app and config version are unchanged. Answers 304 when the
+    client's If-None-Match is still current.
+    """
+    global _apps_cache
 
     scheduler = get_app_scheduler()
     if not scheduler:
-        return AppsListResponse(apps=[])
+        body = AppsListResponse(apps=[]).model_dump_json()
+        return Response(content=body, media_type="application/json")
 
-    apps_list = []
     active_name = scheduler.active_app_name
+    key = (id(scheduler), active_name, get_config_manager().version)
+    now = time.monotonic()
+
+    cached = _apps_cache
+    if cached is None or cached[0] != key or now - cached[1] >= _APPS_TTL:
+        cached = _apps_cache = (key, now, *_encode_apps(scheduler, active_name))
+
+    _, _, body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"etag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"etag": etag})
+
+
+def _encode_apps(scheduler: AppScheduler, active_name: str | None) -> tuple[bytes, str]:
+    """Encode the apps list and derive its ETag.
+
+    Args:
+        scheduler: Running app scheduler
+        active_name: Name of the active app
+
+    Returns:
+        Tuple of (JSON body, quoted ETag)
+    """
+    apps_list = []
 
     for name, app in scheduler.get_all_apps().items():
         metadata = app.metadata
 
-        # Build config schema for UI
-        schema = {}
-        for field_name, field_schema in app.config_schema.items():
-            schema[field_name] = {
-                "type": field_schema.type,
-                "label": field_schema.label,
-                "description": field_schema.description,
-                "default": field_schema.default,
-                "required": field_schema.required,
-                "min_value": field_schema.min_value,
-                "max_value": field_schema.max_value,
-                "options": field_schema.options,
-            }
-
+        # Built from registered apps; skip revalidating every config dict
         apps_list.append(
-            AppInfo(
+            AppInfo.model_construct(
                 name=name,
                 display_name=metadata.display_name,
                 description=metadata.description,
@@ -60,19 +86,18 @@ async def list_apps() -> AppsListResponse:
                 active=(name == active_name),
                 requires_network=metadata.requires_network,
                 requires_credentials=metadata.requires_credentials,
-                config_schema=schema,
+                config_schema=app.serialized_schema,
                 current_config=app.config,
             )
         )
 
-    return AppsListResponse(apps=apps_list)
+    body = AppsListResponse.model_construct(apps=apps_list).model_dump_json().encode()
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
 
 
 @router.get("/{app_name}")
 async def get_app(app_name: str) -> AppInfo:
     """Get details for a specific app."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not running")
@@ -84,16 +109,6 @@ async def get_app(app_name: str) -> AppInfo:
     metadata = app.metadata
     active_name = scheduler.active_app_name
 
-    schema = {}
-    for field_name, field_schema in app.config_schema.items():
-        schema[field_name] = {
-            "type": field_schema.type,
-            "label": field_schema.label,
-            "description": field_schema.description,
-            "default": field_schema.default,
-            "required": field_schema.required,
-        }
-
     return AppInfo(
         name=app_name,
         display_name=metadata.display_name,
@@ -102,7 +117,7 @@ async def get_app(app_name: str) -> AppInfo:
         active=(app_name == active_name),
         requires_network=metadata.requires_network,
         requires_credentials=metadata.requires_credentials,
-        config_schema=schema,
+        config_schema=app.serialized_schema,
         current_config=app.config,
     )
 
@@ -110,8 +125,6 @@ async def get_app(app_name: str) -> AppInfo:
 @router.post("/{app_name}/activate")
 async def activate_app(app_name: str) -> APIResponse:
     """Activate a specific app."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not running")
@@ -134,8 +147,6 @@ async def activate_app(app_name: str) -> APIResponse:
 @router.put("/{app_name}/config")
 async def update_app_config(app_name: str, request: AppConfigRequest) -> APIResponse:
     """Update app configuration."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not running")
@@ -168,8 +179,6 @@ async def update_app_config(app_name: str, request: AppConfigRequest) -> APIResp
 @router.post("/next")
 async def next_app() -> APIResponse:
     """Switch to the next app."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not running")
@@ -192,8 +201,6 @@ async def next_app() -> APIResponse:
 @router.post("/previous")
 async def previous_app() -> APIResponse:
     """Switch to the previous app."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not running")
@@ -216,8 +223,6 @@ async def previous_app() -> APIResponse:
 @router.post("/rotation")
 async def set_rotation(request: RotationRequest) -> APIResponse:
     """Configure app rotation settings."""
-    from ...apps import get_app_scheduler
-
     scheduler = get_app_scheduler()
     if scheduler:
         scheduler.set_rotation(request.enabled, request.interval)
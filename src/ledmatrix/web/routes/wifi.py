@@ -8,12 +8,14 @@ import logging
 
 from fastapi import APIRouter, HTTPException
 
+from ...network import get_network_manager
+from ...network.wifi import WiFiManager
+from ..responses import ORJSONResponse
 from ..schemas import (
     APIResponse,
     WiFiConnectRequest,
     WiFiNetworksResponse,
     WiFiStatusResponse,
-    WiFiNetwork,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,8 +26,6 @@ router = APIRouter(prefix="/api/wifi", tags=["wifi"])
 @router.get("/status")
 async def wifi_status() -> WiFiStatusResponse:
     """Get WiFi connection status."""
-    from ...network import get_network_manager
-
     manager = get_network_manager()
     info = await manager.get_connection_info()
 
@@ -38,27 +38,20 @@ async def wifi_status() -> WiFiStatusResponse:
     )
 
 
-@router.get("/networks")
-async def scan_networks() -> WiFiNetworksResponse:
-    """Scan for available WiFi networks."""
-    from ...network import get_network_manager
+@router.get("/networks", response_model=WiFiNetworksResponse)
+async def scan_networks(refresh: bool = False) -> ORJSONResponse:
+    """Scan for available WiFi networks.
 
+    Recent scan results are reused unless refresh is set. The scan's
+    dataclasses have the same fields as the response schema, so orjson
+    encodes them directly without building a model per network.
+    """
     manager = get_network_manager()
 
     try:
-        networks = await manager.scan_networks()
-
-        return WiFiNetworksResponse(
-            networks=[
-                WiFiNetwork(
-                    ssid=n.ssid,
-                    signal=n.signal,
-                    security=n.security,
-                    in_use=n.in_use,
-                )
-                for n in networks
-            ]
-        )
+        networks = await manager.scan_networks(force=refresh)
+
+        return ORJSONResponse({"networks": networks})
 
     except Exception as e:
         logger.error("WiFi scan failed: %s", e)
@@ -68,8 +61,6 @@ async def scan_networks() -> WiFiNetworksResponse:
 @router.post("/connect")
 async def wifi_connect(request: WiFiConnectRequest) -> APIResponse:
     """Connect to a WiFi network."""
-    from ...network import get_network_manager
-
     manager = get_network_manager()
 
     logger.info("Connecting to WiFi: %s", request.ssid)
@@ -94,8 +85,6 @@ async def wifi_connect(request: WiFiConnectRequest) -> APIResponse:
 @router.post("/disconnect")
 async def wifi_disconnect() -> APIResponse:
     """Disconnect from current WiFi network."""
-    from ...network import get_network_manager
-
     manager = get_network_manager()
 
     await manager.disconnect()
@@ -106,8 +95,6 @@ async def wifi_disconnect() -> APIResponse:
 @router.post("/portal/start")
 async def start_portal() -> APIResponse:
     """Start the captive portal for WiFi setup."""
-    from ...network import get_network_manager
-
     manager = get_network_manager()
 
     success = await manager.start_captive_portal()
@@ -121,8 +108,6 @@ async def start_portal() -> APIResponse:
 @router.post("/portal/stop")
 async def stop_portal() -> APIResponse:
     """Stop the captive portal."""
-    from ...network import get_network_manager
-
     manager = get_network_manager()
 
     await manager.stop_captive_portal()
@@ -133,8 +118,6 @@ async def stop_portal() -> APIResponse:
 @router.post("/forget")
 async def forget_network() -> APIResponse:
     """Forget the saved WiFi network."""
-    from ...network.wifi import WiFiManager
-
     wifi = WiFiManager()
     await wifi.forget_network()
 
@@ -6,7 +6,9 @@ Provides type-safe request parsing and response serialization.
 import re
 from typing import Any
 
-from pydantic import BaseModel, Field, SecretStr, field_validator
+from pydantic import BaseModel, Field, field_validator
+
+_SSID_RE = re.compile(r"^[\w\s\-\.\!\@\#\$\%\&\*\(\)]+$")
 
 
 # =============================================================================
@@ -15,21 +17,24 @@ from pydantic import BaseModel, Field, SecretStr, field_validator
 
 
 class LoginRequest(BaseModel):
-    """Login request."""
+    """Login request.
+
+    Passwords are plain strings kept out of repr(); handlers must not log them.
+    """
 
-    password: SecretStr
+    password: str = Field(..., repr=False)
 
 
 class SetupPasswordRequest(BaseModel):
     """Initial password setup request."""
 
-    password: SecretStr = Field(..., min_length=8)
-    confirm_password: SecretStr = Field(..., min_length=8)
+    password: str = Field(..., min_length=8, repr=False)
+    confirm_password: str = Field(..., min_length=8, repr=False)
 
     @field_validator("confirm_password")
     @classmethod
-    def passwords_match(cls, v: SecretStr, info) -> SecretStr:
-        if "password" in info.data and v.get_secret_value() != info.data["password"].get_secret_value():
+    def passwords_match(cls, v: str, info) -> str:
+        if "password" in info.data and v != info.data["password"]:
             raise ValueError("Passwords do not match")
         return v
 
@@ -43,7 +48,7 @@ class WiFiConnectRequest(BaseModel):
     @field_validator("ssid")
     @classmethod
     def validate_ssid(cls, v: str) -> str:
-        if not re.match(r"^[\w\s\-\.\!\@\#\$\%\&\*\(\)]+$", v):
+        if not _SSID_RE.match(v):
             raise ValueError("SSID contains invalid characters")
         return v
 
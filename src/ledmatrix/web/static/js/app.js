@@ -41,9 +41,18 @@ async function apiPut(endpoint, data) {
 // Status & Dashboard
 // ============================================================================
 
+// ETag of the last status shown; unchanged status comes back as 304
+let statusEtag = null;
+
 async function loadStatus() {
     try {
-        const data = await apiGet('/api/status');
+        const resp = await fetch('/api/status', {
+            headers: statusEtag ? { 'If-None-Match': statusEtag } : {}
+        });
+        if (resp.status === 304) return;
+        if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+        statusEtag = resp.headers.get('ETag');
+        const data = await resp.json();
 
         // Update status elements if they exist
         const activeApp = document.getElementById('activeApp');